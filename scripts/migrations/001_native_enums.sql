@@ -0,0 +1,79 @@
+-- Convert enum-like VARCHAR columns to native PostgreSQL ENUM types.
+--
+-- create_all() creates the types on a fresh database but never alters
+-- existing columns. Safe to re-run: existing types are kept and columns
+-- that already use the enum are skipped. Rewrites every table it
+-- touches, including price_records.
+
+BEGIN;
+
+DO $$ BEGIN
+    CREATE TYPE source_app AS ENUM ('tager_elsaada', 'ben_soliman');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE job_status AS ENUM ('pending', 'running', 'completed', 'failed');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE job_type AS ENUM ('full', 'incremental', 'categories', 'offers');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE stock_status AS ENUM ('in_stock', 'out_of_stock', 'limited', 'unknown');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$ BEGIN
+    CREATE TYPE unit_type AS ENUM ('piece', 'kg', 'gram', 'liter', 'ml', 'pack', 'box', 'carton');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- These two were free text; map values outside the enum before casting
+UPDATE price_records
+SET stock_status = 'unknown'
+WHERE stock_status::text NOT IN ('in_stock', 'out_of_stock', 'limited', 'unknown');
+
+UPDATE products
+SET unit_type = 'piece'
+WHERE unit_type::text NOT IN ('piece', 'kg', 'gram', 'liter', 'ml', 'pack', 'box', 'carton');
+
+DO $$
+DECLARE
+    col record;
+BEGIN
+    FOR col IN
+        SELECT * FROM (VALUES
+            ('categories', 'source_app', 'source_app'),
+            ('brands', 'source_app', 'source_app'),
+            ('products', 'source_app', 'source_app'),
+            ('products', 'unit_type', 'unit_type'),
+            ('price_records', 'source_app', 'source_app'),
+            ('price_records', 'stock_status', 'stock_status'),
+            ('offers', 'source_app', 'source_app'),
+            ('scrape_jobs', 'source_app', 'source_app'),
+            ('scrape_jobs', 'job_type', 'job_type'),
+            ('scrape_jobs', 'status', 'job_status'),
+            ('credentials', 'source_app', 'source_app')
+        ) AS t(table_name, column_name, type_name)
+    LOOP
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns c
+            WHERE c.table_schema = current_schema()
+              AND c.table_name = col.table_name
+              AND c.column_name = col.column_name
+              AND c.udt_name <> col.type_name
+        ) THEN
+            EXECUTE format(
+                'ALTER TABLE %I ALTER COLUMN %I TYPE %I USING %I::%I',
+                col.table_name, col.column_name, col.type_name,
+                col.column_name, col.type_name
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+COMMIT;
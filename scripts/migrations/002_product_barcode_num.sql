@@ -0,0 +1,22 @@
+-- Add products.barcode_num, the indexed BIGINT copy of numeric barcodes
+-- used for cross-app matching.
+--
+-- Backfill follows barcode_to_int(): surrounding whitespace is ignored
+-- and only all-digit barcodes of at most 18 digits are converted; other
+-- barcodes keep barcode_num NULL and match on the raw string.
+
+BEGIN;
+
+ALTER TABLE products ADD COLUMN IF NOT EXISTS barcode_num BIGINT;
+
+UPDATE products
+SET barcode_num = substring(barcode FROM '^\s*([0-9]{1,18})\s*$')::bigint
+WHERE barcode_num IS NULL
+  AND barcode ~ '^\s*[0-9]{1,18}\s*$';
+
+CREATE INDEX IF NOT EXISTS idx_product_barcode_num ON products (barcode_num);
+
+-- Replaced by idx_product_barcode_num
+DROP INDEX IF EXISTS idx_product_barcode;
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Add the product search columns and indexes: the stored full-text
+-- search vector and a trigram index for substring (ILIKE) search on
+-- the name.
+--
+-- Adding the generated column rewrites the products table.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE products ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(name_ar, '')
+            || ' ' || coalesce(brand, '') || ' ' || coalesce(sku, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_product_fts ON products USING gin (search_vector);
+
+CREATE INDEX IF NOT EXISTS idx_product_name_trgm ON products USING gin (name gin_trgm_ops);
+
+COMMIT;
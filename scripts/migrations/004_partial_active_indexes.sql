@@ -0,0 +1,16 @@
+-- Add partial WHERE is_active indexes for active-product and
+-- active-offer queries.
+--
+-- idx_product_source (source_app) is kept for queries that filter on
+-- source_app alone. idx_offer_active keeps its name but changes
+-- definition, so it is rebuilt.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_product_source_active
+    ON products (source_app) WHERE is_active;
+
+DROP INDEX IF EXISTS idx_offer_active;
+CREATE INDEX idx_offer_active ON offers (end_date) WHERE is_active;
+
+COMMIT;
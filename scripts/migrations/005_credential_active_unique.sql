@@ -0,0 +1,13 @@
+-- Allow inactive credentials to share a source_app with the active one.
+--
+-- The table-wide UNIQUE (source_app) constraint is replaced by a partial
+-- unique index that enforces one active credential per source app.
+
+BEGIN;
+
+ALTER TABLE credentials DROP CONSTRAINT IF EXISTS credentials_source_app_key;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_credential_source_active
+    ON credentials (source_app) WHERE is_active;
+
+COMMIT;
@@ -15,6 +15,9 @@ from sqlalchemy import select
 from src.database.connection import get_async_session, init_db
 from src.models.database import Product, Category, Brand, PriceRecord, ScrapeJob
 from src.models.enums import SourceApp
+from src.models.api_schemas import ItemsEnvelope
+from src.utils.serialization import loads, decode
+from src.utils.event_loop import install_uvloop
 
 # Ben Soliman API Configuration
 BASE_URL = "http://41.65.168.38:8001"
@@ -35,6 +38,9 @@ HEADERS = {
 PROJECT_ROOT = Path(__file__).parent.parent
 IMAGES_DIR = PROJECT_ROOT / "static" / "images" / "products"
 
+# Maximum number of images downloaded at the same time
+IMAGE_DOWNLOAD_CONCURRENCY = 16
+
 
 async def download_image(client: httpx.AsyncClient, image_name: str, product_id: str) -> str | None:
     """Download product image and save locally.
@@ -43,13 +49,12 @@ async def download_image(client: httpx.AsyncClient, image_name: str, product_id:
     - Images are at /ItemImage/{ImageName} (not /Icons/)
     - ImageName field from API contains the actual filename
     - Examples: 4020801.png, 1_zoUHf1Q.png, etc.
+
+    IMAGES_DIR must already exist.
     """
     if not image_name:
         return None
 
-    # Create images directory if needed
-    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
-
     # Generate local filename (use product_id for consistency)
     ext = Path(image_name).suffix or ".png"
     local_filename = f"ben_soliman_{product_id}{ext}"
@@ -81,6 +86,29 @@ async def download_image(client: httpx.AsyncClient, image_name: str, product_id:
     return None
 
 
+async def download_images(client: httpx.AsyncClient, products: list) -> dict:
+    """Download the images of all products concurrently.
+
+    Returns a mapping of product external ID to local image path (None
+    if the product has no image or the download failed).
+    """
+    # Create images directory once, not per image
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(IMAGE_DOWNLOAD_CONCURRENCY)
+
+    async def download(prod_data: dict) -> str | None:
+        async with semaphore:
+            return await download_image(
+                client, prod_data.get("ImageName"), str(prod_data.get("ItemCode", ""))
+            )
+
+    paths = await asyncio.gather(*(download(prod_data) for prod_data in products))
+    return {
+        str(prod_data.get("ItemCode", "")): path
+        for prod_data, path in zip(products, paths)
+    }
+
+
 async def fetch_categories(client: httpx.AsyncClient) -> list:
     """Fetch categories from Ben Soliman API."""
     print("Fetching categories...")
@@ -89,7 +117,7 @@ async def fetch_categories(client: httpx.AsyncClient) -> list:
         params={"domain_id": 2},
         headers=HEADERS,
     )
-    data = resp.json()
+    data = loads(resp.content)
     categories = data.get("categories", [])
     print(f"Found {len(categories)} categories")
     return categories
@@ -106,8 +134,8 @@ async def fetch_products(client: httpx.AsyncClient, category_id: int = None) ->
         params=params,
         headers=HEADERS,
     )
-    data = resp.json()
-    return data.get("data", [])
+    # Only "data" is decoded; the rest of the envelope is skipped
+    return decode(resp.content, ItemsEnvelope).data
 
 
 async def fetch_brands(client: httpx.AsyncClient) -> list:
@@ -118,7 +146,7 @@ async def fetch_brands(client: httpx.AsyncClient) -> list:
         params={"domain_id": 2},
         headers=HEADERS,
     )
-    data = resp.json()
+    data = loads(resp.content)
     brands = data.get("Brands", [])
     print(f"Found {len(brands)} brands")
     return brands
@@ -230,6 +258,10 @@ async def main():
         all_products = await fetch_products(client)
         print(f"Found {len(all_products)} products")
 
+        # Download images up front, concurrently, instead of one per product
+        print("\nDownloading images...")
+        image_paths = await download_images(client, all_products)
+
         # Store products and prices
         products_new = 0
         products_updated = 0
@@ -265,9 +297,8 @@ async def main():
                 if sell_price and item_price and float(item_price) > float(sell_price):
                     discount_pct = round((1 - float(sell_price) / float(item_price)) * 100, 2)
 
-                # Download image
                 image_name = prod_data.get("ImageName")
-                local_image_path = await download_image(client, image_name, external_id)
+                local_image_path = image_paths.get(external_id)
                 # Keep original URL as fallback (using correct /ItemImage/ path)
                 original_image_url = f"{IMAGE_SERVER}/ItemImage/{image_name}" if image_name else None
 
@@ -356,4 +387,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -20,6 +20,8 @@ from sqlalchemy import select
 from src.database.connection import get_async_session, init_db
 from src.models.database import Product, Category, Brand, PriceRecord, ScrapeJob
 from src.models.enums import SourceApp
+from src.utils.serialization import loads
+from src.utils.event_loop import install_uvloop
 
 # Tager elSa3ada API Configuration
 BASE_URL = "https://app.tagerelsa3ada.com/api"
@@ -34,15 +36,18 @@ HEADERS = {
 PROJECT_ROOT = Path(__file__).parent.parent
 IMAGES_DIR = PROJECT_ROOT / "static" / "images" / "products"
 
+# Maximum number of images downloaded at the same time
+IMAGE_DOWNLOAD_CONCURRENCY = 16
+
 
 async def download_image(client: httpx.AsyncClient, image_url: str, product_id: str) -> str | None:
-    """Download product image and save locally."""
+    """Download product image and save locally.
+
+    IMAGES_DIR must already exist.
+    """
     if not image_url:
         return None
 
-    # Create images directory if needed
-    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
-
     # Generate local filename
     ext = ".webp"  # Tager uses webp images
     local_filename = f"tager_elsaada_{product_id}{ext}"
@@ -65,6 +70,27 @@ async def download_image(client: httpx.AsyncClient, image_url: str, product_id:
     return None
 
 
+async def download_images(client: httpx.AsyncClient, products: list) -> dict:
+    """Download the images of a page of products concurrently.
+
+    Returns a mapping of product external ID to local image path (None
+    if the product has no image or the download failed).
+    """
+    semaphore = asyncio.Semaphore(IMAGE_DOWNLOAD_CONCURRENCY)
+
+    async def download(prod_data: dict) -> str | None:
+        base_image = prod_data.get("base_image", {})
+        image_url = base_image.get("url") if base_image else None
+        async with semaphore:
+            return await download_image(client, image_url, str(prod_data.get("id", "")))
+
+    paths = await asyncio.gather(*(download(prod_data) for prod_data in products))
+    return {
+        str(prod_data.get("id", "")): path
+        for prod_data, path in zip(products, paths)
+    }
+
+
 async def fetch_categories(client: httpx.AsyncClient) -> list:
     """Fetch categories from Tager elSa3ada API."""
     print("Fetching categories...")
@@ -72,7 +98,7 @@ async def fetch_categories(client: httpx.AsyncClient) -> list:
         f"{BASE_URL}/v1/categories",
         headers=HEADERS,
     )
-    data = resp.json()
+    data = loads(resp.content)
     categories = data.get("data", [])
     print(f"Found {len(categories)} categories")
     return categories
@@ -90,7 +116,7 @@ async def fetch_vendors(client: httpx.AsyncClient) -> list:
             params={"page": page, "per_page": 100},
             headers=HEADERS,
         )
-        data = resp.json()
+        data = loads(resp.content)
         vendors = data.get("data", {}).get("data", [])
 
         if not vendors:
@@ -114,7 +140,7 @@ async def fetch_products(client: httpx.AsyncClient, page: int = 1, per_page: int
         params={"page": page, "per_page": per_page},
         headers=HEADERS,
     )
-    return resp.json()
+    return loads(resp.content)
 
 
 async def main():
@@ -231,6 +257,9 @@ async def main():
         total_products = first_page.get("data", {}).get("meta", {}).get("total", 0)
         print(f"Total products to fetch: {total_products}")
 
+        # Create images directory once, not per image
+        IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+
         # Store products and prices
         products_new = 0
         products_updated = 0
@@ -246,6 +275,9 @@ async def main():
                 if not products_data:
                     break
 
+                # Download the page's images concurrently, not one per product
+                image_paths = await download_images(client, products_data)
+
                 for prod_data in products_data:
                     external_id = str(prod_data.get("id", ""))
                     sku = prod_data.get("sku", "")
@@ -272,8 +304,7 @@ async def main():
                     base_image = prod_data.get("base_image", {})
                     original_image_url = base_image.get("url") if base_image else None
 
-                    # Download image
-                    local_image_path = await download_image(client, original_image_url, external_id)
+                    local_image_path = image_paths.get(external_id)
 
                     # Get price info from units
                     units = prod_data.get("units", [])
@@ -382,4 +413,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -13,6 +13,15 @@ class Settings(BaseSettings):
         description="PostgreSQL connection URL"
     )
 
+    db_pool_size: int = Field(
+        default=5,
+        description="Persistent database connections kept per process"
+    )
+    db_max_overflow: int = Field(
+        default=5,
+        description="Extra connections allowed above the pool size under load"
+    )
+
     # Redis
     redis_url: str = Field(
         default="redis://localhost:6379/0",
@@ -49,6 +58,7 @@ class Settings(BaseSettings):
     # Rate limiting
     requests_per_second: float = Field(default=1.5)
     burst_size: int = Field(default=3)
+    max_concurrent_requests: int = Field(default=4)
 
     # Request timing (anti-detection)
     min_request_delay: float = Field(default=0.5)
@@ -6,7 +6,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 
 from src.database.connection import init_db, close_db
 
@@ -32,6 +32,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down dashboard application...")
+    from src.dashboard.routes.api import close_image_client
+    await close_image_client()
     try:
         await close_db()
     except Exception:
@@ -45,6 +47,7 @@ def create_app() -> FastAPI:
         description="Dashboard for viewing scraped competitor product data",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Setup templates
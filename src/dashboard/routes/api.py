@@ -1,13 +1,14 @@
 """JSON API routes for dashboard data."""
 from typing import Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Query, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, func
 import httpx
 
 from src.database.connection import get_async_session
+from src.database.repositories.price_repo import PriceRepository
 from src.models.database import Product, Category, PriceRecord, ScrapeJob
 from src.models.enums import SourceApp
 
@@ -20,6 +21,37 @@ IMAGE_HEADERS = {
     "os": "android",
 }
 
+# Shared image proxy client; keeps connections to the image hosts alive
+# across requests instead of reconnecting for every image
+_image_client: Optional[httpx.AsyncClient] = None
+
+
+def get_image_client() -> httpx.AsyncClient:
+    """Get or create the shared image proxy HTTP client.
+
+    Returns:
+        httpx.AsyncClient instance.
+    """
+    global _image_client
+
+    if _image_client is None:
+        _image_client = httpx.AsyncClient(
+            timeout=10.0,
+            headers=IMAGE_HEADERS,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    return _image_client
+
+
+async def close_image_client() -> None:
+    """Close the shared image proxy HTTP client."""
+    global _image_client
+
+    if _image_client is not None:
+        await _image_client.aclose()
+        _image_client = None
+
 
 class StatsResponse(BaseModel):
     """Dashboard statistics response."""
@@ -119,7 +151,7 @@ async def get_price_history(
             raise HTTPException(status_code=404, detail="Product not found")
 
         # Get price history
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         prices_result = await session.execute(
             select(PriceRecord)
             .where(
@@ -132,7 +164,7 @@ async def get_price_history(
 
         history = [
             PriceHistoryPoint(
-                date=price.recorded_at.isoformat() if price.recorded_at else "",
+                date=price.recorded_at.isoformat(timespec="seconds") if price.recorded_at else "",
                 price=float(price.price),
                 is_available=price.is_available,
             )
@@ -157,16 +189,25 @@ async def get_products(
 ):
     """Get filtered products list (for HTMX)."""
     async with get_async_session() as session:
-        query = select(Product).where(Product.is_active == True)
-
-        if source:
-            query = query.where(Product.source_app == source)
+        # Only the columns in the response; rows are plain tuples rather
+        # than hydrated Product entities
+        query = select(
+            Product.id,
+            Product.external_id,
+            Product.name,
+            Product.source_app,
+            Product.image_url,
+        ).where(Product.is_active == True)
+
+        source_app = SourceApp.try_parse(source) if source else None
+        if source_app:
+            query = query.where(Product.source_app == source_app.value)
 
         if category_id:
             query = query.where(Product.category_id == category_id)
 
         if search:
-            query = query.where(Product.name.ilike(f"%{search}%"))
+            query = query.where(Product.search_matches(search))
 
         # Get total
         count_query = select(func.count()).select_from(query.subquery())
@@ -175,18 +216,15 @@ async def get_products(
         # Paginate
         query = query.order_by(Product.name).offset((page - 1) * per_page).limit(per_page)
         result = await session.execute(query)
-        products = list(result.scalars().all())
+        products = result.all()
 
-        # Get latest prices
+        # Get latest prices for the whole page in one query
+        latest_prices = await PriceRepository(session).get_latest_for_products(
+            [product.id for product in products]
+        )
         products_data = []
         for product in products:
-            price_result = await session.execute(
-                select(PriceRecord)
-                .where(PriceRecord.product_id == product.id)
-                .order_by(desc(PriceRecord.recorded_at))
-                .limit(1)
-            )
-            latest_price = price_result.scalar_one_or_none()
+            latest_price = latest_prices.get(product.id)
 
             products_data.append({
                 "id": product.id,
@@ -198,13 +236,14 @@ async def get_products(
                 "is_available": latest_price.is_available if latest_price else False,
             })
 
-    return {
+    # Plain JSON-native values: skip jsonable_encoder and serialize directly
+    return ORJSONResponse({
         "products": products_data,
         "total": total or 0,
         "page": page,
         "per_page": per_page,
         "total_pages": (total + per_page - 1) // per_page if total else 1,
-    }
+    })
 
 
 @router.get("/comparison/{barcode}")
@@ -214,7 +253,7 @@ async def get_comparison(barcode: str):
         # Get products with this barcode
         products_result = await session.execute(
             select(Product).where(
-                Product.barcode == barcode,
+                Product.barcode_matches(barcode),
                 Product.is_active == True,
             )
         )
@@ -229,15 +268,12 @@ async def get_comparison(barcode: str):
             "tager_elsaada": None,
         }
 
+        latest_prices = await PriceRepository(session).get_latest_for_products(
+            [product.id for product in products]
+        )
+
         for product in products:
-            # Get latest price
-            price_result = await session.execute(
-                select(PriceRecord)
-                .where(PriceRecord.product_id == product.id)
-                .order_by(desc(PriceRecord.recorded_at))
-                .limit(1)
-            )
-            latest_price = price_result.scalar_one_or_none()
+            latest_price = latest_prices.get(product.id)
 
             app_key = (
                 "ben_soliman"
@@ -280,7 +316,7 @@ async def get_daily_prices(
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
 
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
         # Get daily aggregates
         result = await session.execute(
@@ -308,11 +344,11 @@ async def get_daily_prices(
             for row in result.all()
         ]
 
-    return {
+    return ORJSONResponse({
         "product_id": product.id,
         "product_name": product.name,
         "daily_prices": daily_data,
-    }
+    })
 
 
 @router.get("/image-proxy")
@@ -331,17 +367,16 @@ async def image_proxy(url: str):
         raise HTTPException(status_code=400, detail="Invalid image host")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=IMAGE_HEADERS)
-
-            if response.status_code == 200:
-                content_type = response.headers.get("content-type", "image/png")
-                return Response(
-                    content=response.content,
-                    media_type=content_type,
-                    headers={"Cache-Control": "public, max-age=86400"}  # Cache for 24 hours
-                )
-            else:
-                raise HTTPException(status_code=404, detail="Image not found")
+        response = await get_image_client().get(url)
+
+        if response.status_code == 200:
+            content_type = response.headers.get("content-type", "image/png")
+            return Response(
+                content=response.content,
+                media_type=content_type,
+                headers={"Cache-Control": "public, max-age=86400"}  # Cache for 24 hours
+            )
+        else:
+            raise HTTPException(status_code=404, detail="Image not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch image: {str(e)}")
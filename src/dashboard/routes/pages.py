@@ -6,6 +6,8 @@ from fastapi.responses import HTMLResponse
 from sqlalchemy import select, func, desc
 
 from src.database.connection import get_async_session
+from src.database.repositories.job_repo import ScrapeJobRepository
+from src.database.repositories.price_repo import PriceRepository
 from src.models.database import Product, Category, Brand, PriceRecord, ScrapeJob
 from src.models.enums import SourceApp
 
@@ -46,12 +48,7 @@ async def home(request: Request):
             category_count = await session.scalar(select(func.count(Category.id))) or 0
 
             # Get recent scrape jobs
-            recent_jobs_result = await session.execute(
-                select(ScrapeJob)
-                .order_by(desc(ScrapeJob.created_at))
-                .limit(5)
-            )
-            recent_jobs = list(recent_jobs_result.scalars().all())
+            recent_jobs = await ScrapeJobRepository(session).list_summaries(limit=5)
 
             # Get total price records
             price_record_count = await session.scalar(select(func.count(PriceRecord.id))) or 0
@@ -107,8 +104,9 @@ async def products_page(
         # Build query
         query = select(Product).where(Product.is_active == True)
 
-        if source and source.strip():
-            query = query.where(Product.source_app == source)
+        source_app = SourceApp.try_parse(source.strip()) if source else None
+        if source_app:
+            query = query.where(Product.source_app == source_app.value)
 
         if category_id_int:
             query = query.where(Product.category_id == category_id_int)
@@ -117,7 +115,7 @@ async def products_page(
             query = query.where(Product.brand_id == brand_id_int)
 
         if search:
-            query = query.where(Product.name.ilike(f"%{search}%"))
+            query = query.where(Product.search_matches(search))
 
         # Get total count for pagination
         count_query = select(func.count()).select_from(query.subquery())
@@ -141,20 +139,17 @@ async def products_page(
         )
         brands = list(brands_result.scalars().all())
 
-        # Get latest prices for products
-        products_with_prices = []
-        for product in products:
-            price_result = await session.execute(
-                select(PriceRecord)
-                .where(PriceRecord.product_id == product.id)
-                .order_by(desc(PriceRecord.recorded_at))
-                .limit(1)
-            )
-            latest_price = price_result.scalar_one_or_none()
-            products_with_prices.append({
+        # Get latest prices for the whole page in one query
+        latest_prices = await PriceRepository(session).get_latest_for_products(
+            [product.id for product in products]
+        )
+        products_with_prices = [
+            {
                 "product": product,
-                "latest_price": latest_price,
-            })
+                "latest_price": latest_prices.get(product.id),
+            }
+            for product in products
+        ]
 
     total_pages = (total + per_page - 1) // per_page if total else 1
 
@@ -236,7 +231,7 @@ async def product_detail(request: Request, product_id: int):
             )
             matching_result = await session.execute(
                 select(Product).where(
-                    Product.barcode == product.barcode,
+                    Product.barcode_matches(product.barcode),
                     Product.source_app == other_app,
                 )
             )
@@ -261,52 +256,55 @@ async def comparison_page(request: Request):
     templates = request.app.state.templates
 
     async with get_async_session() as session:
-        # Find products with barcodes that exist in both apps
-        # Subquery to find barcodes in both apps
+        # Find products with barcodes that exist in both apps; numeric
+        # barcodes match on their value, others on the raw string
+        barcode_key = Product.barcode_key()
         subquery = (
-            select(Product.barcode)
+            select(barcode_key)
             .where(
-                Product.barcode.isnot(None),
-                Product.barcode != "",
+                barcode_key.isnot(None),
                 Product.is_active == True,
             )
-            .group_by(Product.barcode)
+            .group_by(barcode_key)
             .having(func.count(func.distinct(Product.source_app)) > 1)
         )
 
         # Get products with matching barcodes
         products_result = await session.execute(
             select(Product)
-            .where(Product.barcode.in_(subquery))
-            .order_by(Product.barcode, Product.source_app)
+            .where(barcode_key.in_(subquery))
+            .order_by(barcode_key, Product.source_app)
         )
         products = list(products_result.scalars().all())
 
-        # Group by barcode and get prices
+        # Latest prices of all matched products in one query
+        latest_prices = await PriceRepository(session).get_latest_for_products(
+            [product.id for product in products]
+        )
+
+        # Group by barcode
         comparisons = {}
         for product in products:
-            if product.barcode not in comparisons:
-                comparisons[product.barcode] = {
+            key = (
+                str(product.barcode_num)
+                if product.barcode_num is not None
+                else product.barcode
+            )
+            if key not in comparisons:
+                comparisons[key] = {
                     "barcode": product.barcode,
                     "ben_soliman": None,
                     "tager_elsaada": None,
                 }
 
-            # Get latest price
-            price_result = await session.execute(
-                select(PriceRecord)
-                .where(PriceRecord.product_id == product.id)
-                .order_by(desc(PriceRecord.recorded_at))
-                .limit(1)
-            )
-            latest_price = price_result.scalar_one_or_none()
+            latest_price = latest_prices.get(product.id)
 
             app_key = (
                 "ben_soliman"
                 if product.source_app == SourceApp.BEN_SOLIMAN.value
                 else "tager_elsaada"
             )
-            comparisons[product.barcode][app_key] = {
+            comparisons[key][app_key] = {
                 "product": product,
                 "price": latest_price,
             }
@@ -349,13 +347,9 @@ async def jobs_page(
         total = await session.scalar(select(func.count(ScrapeJob.id)))
 
         # Get paginated jobs
-        jobs_result = await session.execute(
-            select(ScrapeJob)
-            .order_by(desc(ScrapeJob.created_at))
-            .offset((page - 1) * per_page)
-            .limit(per_page)
+        jobs = await ScrapeJobRepository(session).list_summaries(
+            limit=per_page, offset=(page - 1) * per_page
         )
-        jobs = list(jobs_result.scalars().all())
 
     total_pages = (total + per_page - 1) // per_page if total else 1
 
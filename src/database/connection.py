@@ -3,16 +3,17 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
     create_async_engine,
     async_sessionmaker,
 )
-from sqlalchemy.pool import NullPool
 
 from src.config.settings import settings
 from src.models.database import Base
+from src.utils.serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,12 @@ def get_engine() -> AsyncEngine:
         _engine = create_async_engine(
             settings.database_url,
             echo=settings.log_level == "DEBUG",
-            poolclass=NullPool,  # Recommended for async
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_pre_ping=True,  # Drop connections the server closed while idle
+            insertmanyvalues_page_size=1000,  # Rows per batched INSERT
+            json_serializer=dumps,  # orjson for JSONB columns
+            json_deserializer=loads,
         )
         logger.info("Database engine created")
 
@@ -88,11 +94,13 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
 async def init_db() -> None:
     """Initialize the database schema.
 
-    Creates all tables defined in the models.
+    Creates all tables defined in the models, after the pg_trgm
+    extension their trigram indexes need.
     """
     engine = get_engine()
 
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
     logger.info("Database tables created")
@@ -1,4 +1,5 @@
 from .product_repo import ProductRepository
 from .price_repo import PriceRepository
+from .job_repo import ScrapeJobRepository
 
-__all__ = ["ProductRepository", "PriceRepository"]
+__all__ = ["ProductRepository", "PriceRepository", "ScrapeJobRepository"]
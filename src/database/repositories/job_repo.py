@@ -0,0 +1,73 @@
+"""Scrape job repository for database operations."""
+from typing import List
+
+from sqlalchemy import select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.database import ScrapeJob
+from src.models.schemas import ScrapeJobSummary
+from src.models.enums import SourceApp
+
+
+class ScrapeJobRepository:
+    """Repository for scrape job database operations."""
+
+    # Columns read for job summaries (no ORM entity hydration)
+    SUMMARY_COLUMNS = (
+        ScrapeJob.id,
+        ScrapeJob.source_app,
+        ScrapeJob.job_type,
+        ScrapeJob.status,
+        ScrapeJob.started_at,
+        ScrapeJob.completed_at,
+        ScrapeJob.products_scraped,
+        ScrapeJob.products_updated,
+        ScrapeJob.products_new,
+        ScrapeJob.errors_count,
+        ScrapeJob.error_details,
+        ScrapeJob.created_at,
+    )
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session.
+
+        Args:
+            session: AsyncSession instance.
+        """
+        self.session = session
+
+    async def list_summaries(
+        self, limit: int = 20, offset: int = 0
+    ) -> List[ScrapeJobSummary]:
+        """Get job summaries, newest first.
+
+        Rows come straight from the database, so summaries are built
+        with model_construct() and skip validation. source_app is
+        converted to SourceApp by hand, since no validator runs.
+
+        Args:
+            limit: Maximum number of jobs.
+            offset: Number of jobs to skip.
+
+        Returns:
+            List of job summaries.
+        """
+        result = await self.session.execute(
+            select(*self.SUMMARY_COLUMNS)
+            .order_by(desc(ScrapeJob.created_at))
+            .offset(offset)
+            .limit(limit)
+        )
+
+        summaries = []
+        for row in result.mappings().all():
+            duration = None
+            if row["started_at"] and row["completed_at"]:
+                duration = (row["completed_at"] - row["started_at"]).total_seconds()
+            summaries.append(
+                ScrapeJobSummary.model_construct(
+                    **{**row, "source_app": SourceApp(row["source_app"])},
+                    duration_seconds=duration,
+                )
+            )
+        return summaries
@@ -1,9 +1,10 @@
 """Price record repository for database operations."""
-from datetime import datetime, timedelta
-from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Tuple
 from decimal import Decimal
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, func, insert, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.models.database import PriceRecord, Product
 from src.models.schemas import PriceRecordCreate
@@ -13,6 +14,22 @@ from src.models.enums import SourceApp
 class PriceRepository:
     """Repository for price record database operations."""
 
+    # Batches smaller than this use a multi-row INSERT instead of COPY
+    COPY_THRESHOLD = 100
+
+    # Column order for COPY into price_records
+    COPY_COLUMNS = [
+        "product_id",
+        "source_app",
+        "price",
+        "original_price",
+        "discount_percentage",
+        "currency",
+        "is_available",
+        "stock_status",
+        "scrape_job_id",
+    ]
+
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session.
 
@@ -48,6 +65,56 @@ class PriceRepository:
         await self.session.flush()
         return price_record
 
+    async def bulk_insert_prices(
+        self, rows: List[PriceRecordCreate], scrape_job_id: int = None
+    ) -> int:
+        """Insert many price records in one round-trip.
+
+        Large batches are streamed with PostgreSQL COPY through the
+        underlying asyncpg connection; small batches use a multi-row
+        INSERT. Both run inside the session's current transaction.
+
+        Args:
+            rows: Price records to insert.
+            scrape_job_id: Optional scrape job ID for all records.
+
+        Returns:
+            Number of records inserted.
+        """
+        if not rows:
+            return 0
+
+        records = [
+            (
+                row.product_id,
+                row.source_app.value,
+                row.price,
+                row.original_price,
+                row.discount_percentage,
+                row.currency.value,
+                row.is_available,
+                row.stock_status.value if row.stock_status else None,
+                scrape_job_id,
+            )
+            for row in rows
+        ]
+
+        if len(records) < self.COPY_THRESHOLD:
+            await self.session.execute(
+                insert(PriceRecord),
+                [dict(zip(self.COPY_COLUMNS, record)) for record in records],
+            )
+            return len(records)
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            PriceRecord.__tablename__,
+            records=records,
+            columns=self.COPY_COLUMNS,
+        )
+        return len(records)
+
     async def get_latest_for_product(self, product_id: int) -> Optional[PriceRecord]:
         """Get the most recent price record for a product.
 
@@ -65,6 +132,43 @@ class PriceRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_latest_for_products(
+        self, product_ids: List[int]
+    ) -> Dict[int, PriceRecord]:
+        """Get the most recent price record of each of several products.
+
+        One query replaces a get_latest_for_product() call per product. A
+        LATERAL ... LIMIT 1 subquery per product reads only the newest
+        entry of idx_price_product_time, instead of every record of the
+        product as DISTINCT ON would.
+
+        Args:
+            product_ids: Product IDs.
+
+        Returns:
+            Mapping of product_id to its latest price record. Products
+            without price records are absent.
+        """
+        if not product_ids:
+            return {}
+
+        latest = (
+            select(PriceRecord)
+            .where(PriceRecord.product_id == Product.id)
+            .order_by(PriceRecord.recorded_at.desc())
+            .limit(1)
+            .lateral()
+        )
+        latest_record = aliased(PriceRecord, latest)
+
+        result = await self.session.execute(
+            select(latest_record)
+            .select_from(Product)
+            .join(latest, true())
+            .where(Product.id.in_(product_ids))
+        )
+        return {record.product_id: record for record in result.scalars().all()}
+
     async def get_price_history(
         self,
         product_id: int,
@@ -81,7 +185,7 @@ class PriceRepository:
         Returns:
             List of price records ordered by date descending.
         """
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
         result = await self.session.execute(
             select(PriceRecord)
@@ -94,6 +198,35 @@ class PriceRepository:
         )
         return list(result.scalars().all())
 
+    async def load_latest_snapshot(
+        self, source_app: SourceApp
+    ) -> Dict[int, Tuple[Decimal, bool]]:
+        """Load the latest recorded price of every product of a source app.
+
+        One DISTINCT ON scan (served by idx_price_product_time) replaces a
+        latest-price lookup per product during a scrape.
+
+        Args:
+            source_app: Source application.
+
+        Returns:
+            Mapping of product_id to (price, is_available).
+        """
+        result = await self.session.execute(
+            select(
+                PriceRecord.product_id,
+                PriceRecord.price,
+                PriceRecord.is_available,
+            )
+            .where(PriceRecord.source_app == source_app.value)
+            .distinct(PriceRecord.product_id)
+            .order_by(PriceRecord.product_id, PriceRecord.recorded_at.desc())
+        )
+        return {
+            product_id: (price, is_available)
+            for product_id, price, is_available in result.all()
+        }
+
     async def should_record_price(
         self,
         product_id: int,
@@ -140,7 +273,7 @@ class PriceRepository:
         """
         # Get products with this barcode
         products_result = await self.session.execute(
-            select(Product).where(Product.barcode == barcode)
+            select(Product).where(Product.barcode_matches(barcode))
         )
         products = list(products_result.scalars().all())
 
@@ -179,7 +312,7 @@ class PriceRepository:
         Returns:
             Number of records deleted.
         """
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
         result = await self.session.execute(
             delete(PriceRecord).where(PriceRecord.recorded_at < cutoff)
@@ -200,7 +333,7 @@ class PriceRepository:
         Returns:
             List of daily averages with date and average price.
         """
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
         result = await self.session.execute(
             select(
@@ -1,10 +1,11 @@
 """Product repository for database operations."""
-from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import select, update
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Tuple
+from sqlalchemy import select, update, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.database import Product, Category
+from src.models.database import Product, Category, barcode_to_int
 from src.models.schemas import ProductCreate, CategoryCreate
 from src.models.enums import SourceApp
 
@@ -50,7 +51,7 @@ class ProductRepository:
             List of products with matching barcode.
         """
         result = await self.session.execute(
-            select(Product).where(Product.barcode == barcode)
+            select(Product).where(Product.barcode_matches(barcode))
         )
         return list(result.scalars().all())
 
@@ -109,30 +110,144 @@ class ProductRepository:
         product.unit_value = product_data.unit_value
         product.min_order_quantity = product_data.min_order_quantity
         product.extra_data = product_data.extra_data
-        product.last_seen_at = datetime.utcnow()
+        product.last_seen_at = datetime.now(timezone.utc)
 
         await self.session.flush()
         return product
 
+    # Columns overwritten from the incoming row on upsert conflicts
+    _UPDATE_COLUMNS = (
+        "name",
+        "name_ar",
+        "description",
+        "description_ar",
+        "brand",
+        "sku",
+        "barcode",
+        "barcode_num",
+        "image_url",
+        "additional_images",
+        "unit_type",
+        "unit_value",
+        "min_order_quantity",
+        "extra_data",
+    )
+
+    @staticmethod
+    def _upsert_values(product_data: ProductCreate) -> dict:
+        """Build the column values for a product upsert.
+
+        Args:
+            product_data: Product data.
+
+        Returns:
+            Dictionary of column values.
+        """
+        return {
+            "source_app": product_data.source_app.value,
+            "external_id": product_data.external_id,
+            "name": product_data.name,
+            "name_ar": product_data.name_ar,
+            "description": product_data.description,
+            "description_ar": product_data.description_ar,
+            "brand": product_data.brand,
+            "sku": product_data.sku,
+            "barcode": product_data.barcode,
+            "barcode_num": barcode_to_int(product_data.barcode),
+            "image_url": product_data.image_url,
+            "additional_images": product_data.additional_images,
+            "unit_type": product_data.unit_type.value,
+            "unit_value": product_data.unit_value,
+            "min_order_quantity": product_data.min_order_quantity,
+            "extra_data": product_data.extra_data,
+        }
+
     async def upsert(self, product_data: ProductCreate) -> tuple[Product, bool]:
         """Create or update a product.
 
+        Uses a single INSERT ... ON CONFLICT DO UPDATE instead of
+        selecting the product first.
+
         Args:
             product_data: Product data.
 
         Returns:
             Tuple of (product, is_new).
         """
-        existing = await self.get_by_external_id(
-            product_data.source_app, product_data.external_id
+        values = self._upsert_values(product_data)
+        stmt = self._on_conflict_update(pg_insert(Product).values(**values))
+        # xmax is 0 only for freshly inserted rows
+        stmt = stmt.returning(Product, literal_column("xmax = 0").label("is_new"))
+
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
         )
+        product, is_new = result.one()
+        return product, is_new
 
-        if existing:
-            product = await self.update_product(existing, product_data)
-            return product, False
-        else:
-            product = await self.create(product_data)
-            return product, True
+    async def upsert_many(
+        self, products: List[ProductCreate]
+    ) -> Dict[Tuple[str, str], Tuple[int, bool]]:
+        """Create or update many products in one statement.
+
+        Duplicates (same source app and external ID) are collapsed, last
+        one wins, since a single ON CONFLICT statement can't touch the
+        same row twice.
+
+        Args:
+            products: Product data.
+
+        Returns:
+            Mapping of (source_app value, external_id) to (product_id, is_new).
+        """
+        if not products:
+            return {}
+
+        rows = {
+            (product_data.source_app.value, product_data.external_id): self._upsert_values(product_data)
+            for product_data in products
+        }
+        # Execute a single-row template for all rows; SQLAlchemy expands it
+        # into multi-row VALUES pages ("insertmanyvalues"). PostgreSQL
+        # INSERT constructs aren't compile-cached, and compiling an
+        # explicit 500-row VALUES clause costs far more than the round trip.
+        stmt = self._on_conflict_update(pg_insert(Product))
+        # xmax is 0 only for freshly inserted rows
+        stmt = stmt.returning(
+            Product.id,
+            Product.source_app,
+            Product.external_id,
+            literal_column("xmax = 0").label("is_new"),
+        )
+
+        connection = await self.session.connection()
+        result = await connection.execute(stmt, list(rows.values()))
+        return {
+            (source_app, external_id): (product_id, is_new)
+            for product_id, source_app, external_id, is_new in result.all()
+        }
+
+    @staticmethod
+    def _on_conflict_update(stmt):
+        """Turn a product INSERT into an upsert on (source_app, external_id).
+
+        Args:
+            stmt: PostgreSQL INSERT statement for products.
+
+        Returns:
+            Statement updating all data columns on conflict.
+        """
+        return stmt.on_conflict_do_update(
+            index_elements=[Product.source_app, Product.external_id],
+            set_={
+                **{
+                    column: stmt.excluded[column]
+                    for column in ProductRepository._UPDATE_COLUMNS
+                },
+                "last_seen_at": func.now(),
+                "updated_at": func.now(),
+            },
+        )
 
     async def get_all_by_source(
         self, source_app: SourceApp, limit: int = 1000, offset: int = 0
@@ -235,23 +350,90 @@ class CategoryRepository:
     async def upsert(self, category_data: CategoryCreate) -> tuple[Category, bool]:
         """Create or update a category.
 
+        Uses a single INSERT ... ON CONFLICT DO UPDATE instead of
+        selecting the category first.
+
         Args:
             category_data: Category data.
 
         Returns:
             Tuple of (category, is_new).
         """
-        existing = await self.get_by_external_id(
-            category_data.source_app, category_data.external_id
+        values = self._upsert_values(category_data)
+        stmt = self._on_conflict_update(pg_insert(Category).values(**values))
+        # xmax is 0 only for freshly inserted rows
+        stmt = stmt.returning(Category, literal_column("xmax = 0").label("is_new"))
+
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
         )
+        category, is_new = result.one()
+        return category, is_new
+
+    async def upsert_many(self, categories: List[CategoryCreate]) -> int:
+        """Create or update many categories in one batched execute.
+
+        Duplicates (same source app and external ID) are collapsed, last
+        one wins, since a single ON CONFLICT statement can't touch the
+        same row twice.
+
+        Args:
+            categories: Category data.
+
+        Returns:
+            Number of categories written.
+        """
+        if not categories:
+            return 0
+
+        rows = {
+            (category_data.source_app.value, category_data.external_id): self._upsert_values(category_data)
+            for category_data in categories
+        }
+        # Single-row template executed for all rows, as in
+        # ProductRepository.upsert_many
+        stmt = self._on_conflict_update(pg_insert(Category))
+
+        connection = await self.session.connection()
+        await connection.execute(stmt, list(rows.values()))
+        return len(rows)
 
-        if existing:
-            existing.name = category_data.name
-            existing.name_ar = category_data.name_ar
-            existing.image_url = category_data.image_url
-            existing.sort_order = category_data.sort_order
-            await self.session.flush()
-            return existing, False
-        else:
-            category = await self.create(category_data)
-            return category, True
+    @staticmethod
+    def _upsert_values(category_data: CategoryCreate) -> dict:
+        """Build the column values for a category upsert.
+
+        Args:
+            category_data: Category data.
+
+        Returns:
+            Dictionary of column values.
+        """
+        return {
+            "source_app": category_data.source_app.value,
+            "external_id": category_data.external_id,
+            "name": category_data.name,
+            "name_ar": category_data.name_ar,
+            "image_url": category_data.image_url,
+            "sort_order": category_data.sort_order,
+        }
+
+    @staticmethod
+    def _on_conflict_update(stmt):
+        """Turn a category INSERT into an upsert on (source_app, external_id).
+
+        Args:
+            stmt: PostgreSQL INSERT statement for categories.
+
+        Returns:
+            Statement updating all data columns on conflict.
+        """
+        return stmt.on_conflict_do_update(
+            index_elements=[Category.source_app, Category.external_id],
+            set_={
+                "name": stmt.excluded.name,
+                "name_ar": stmt.excluded.name_ar,
+                "image_url": stmt.excluded.image_url,
+                "sort_order": stmt.excluded.sort_order,
+                "updated_at": func.now(),
+            },
+        )
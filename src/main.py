@@ -10,6 +10,7 @@ import structlog
 from src.config.settings import settings
 from src.database.connection import init_db, close_db
 from src.scheduler.scheduler import create_scheduler, register_jobs
+from src.utils.event_loop import install_uvloop
 
 # Global scheduler instance
 scheduler: Optional[asyncio.AbstractEventLoop] = None
@@ -122,6 +123,7 @@ async def main() -> None:
 
 def run() -> None:
     """Entry point for running the application."""
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -0,0 +1,73 @@
+"""msgspec structs for decoding raw competitor API responses.
+
+These are decode-only: JSON bytes are parsed and type-checked in a
+single pass, without Pydantic's per-field validator dispatch. The
+Pydantic ``*Create`` schemas in ``schemas.py`` remain the DB-write tier.
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional, List, Dict, Any, Union
+
+import msgspec
+
+
+class ProductAPIResponse(msgspec.Struct, frozen=True, gc=False, kw_only=True):
+    """Schema for raw product API response.
+
+    NOTE: This is a placeholder. Update fields after API discovery.
+    """
+    id: str
+    name: str
+    name_ar: Optional[str] = None
+    description: Optional[str] = None
+    description_ar: Optional[str] = None
+    category_id: Optional[str] = None
+    category_name: Optional[str] = None
+    brand: Optional[str] = None
+    sku: Optional[str] = None
+    barcode: Optional[str] = None
+    image_url: Optional[str] = None
+    images: Optional[List[str]] = None
+    price: Decimal
+    original_price: Optional[Decimal] = None
+    discount_percentage: Optional[Decimal] = None
+    unit: Optional[str] = None
+    min_order_quantity: Optional[int] = 1
+    stock_status: Optional[str] = None
+    is_available: bool = True
+
+
+class CategoryAPIResponse(msgspec.Struct, frozen=True, gc=False, kw_only=True):
+    """Schema for raw category API response."""
+    id: str
+    name: str
+    name_ar: Optional[str] = None
+    parent_id: Optional[str] = None
+    image_url: Optional[str] = None
+    sort_order: Optional[int] = None
+
+
+class OfferAPIResponse(msgspec.Struct, frozen=True, gc=False, kw_only=True):
+    """Schema for raw offer API response."""
+    id: str
+    title: str
+    title_ar: Optional[str] = None
+    description: Optional[str] = None
+    product_id: Optional[str] = None
+    discount_type: Optional[str] = None
+    discount_value: Optional[Decimal] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+
+class ItemsEnvelope(msgspec.Struct):
+    """Envelope of list endpoints returning {"data": [...]}.
+
+    Only ``data`` is decoded; any other envelope keys (paging metadata,
+    messages) are skipped by the decoder without building Python objects.
+    """
+    data: List[Dict[str, Any]] = []
+
+
+# Some list endpoints return the bare array instead of the envelope
+ItemsResponse = Union[ItemsEnvelope, List[Dict[str, Any]]]
@@ -1,8 +1,10 @@
 """SQLAlchemy ORM models for the database."""
 from datetime import datetime
+from typing import Optional
 from sqlalchemy import (
     Column,
     Integer,
+    BigInteger,
     String,
     Text,
     Numeric,
@@ -11,20 +13,62 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     UniqueConstraint,
+    Computed,
+    cast,
+    update,
+    text,
+    or_,
 )
-from sqlalchemy.dialects.postgresql import JSONB, ARRAY
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY, ENUM, TSVECTOR
+from sqlalchemy.orm import relationship, declarative_base, validates
 from sqlalchemy.sql import func
 
+from .enums import SourceApp, JobStatus, JobType, StockStatus, UnitType
+
 Base = declarative_base()
 
 
+def _pg_enum(enum_cls, name: str) -> ENUM:
+    """Build a native PostgreSQL ENUM from an application enum.
+
+    The enum *values* are stored (not member names), so columns keep
+    reading and writing the same plain strings as before.
+    """
+    return ENUM(*[member.value for member in enum_cls], name=name, metadata=Base.metadata)
+
+
+# Shared native ENUM types (4 bytes per value instead of a varchar)
+source_app_enum = _pg_enum(SourceApp, "source_app")
+job_status_enum = _pg_enum(JobStatus, "job_status")
+job_type_enum = _pg_enum(JobType, "job_type")
+stock_status_enum = _pg_enum(StockStatus, "stock_status")
+unit_type_enum = _pg_enum(UnitType, "unit_type")
+
+
+def barcode_to_int(barcode: Optional[str]) -> Optional[int]:
+    """Convert a numeric barcode (EAN-13, UPC-A, GTIN-14) to an integer.
+
+    Args:
+        barcode: Raw barcode string from the API.
+
+    Returns:
+        Integer barcode, or None if the barcode is empty or not numeric.
+    """
+    if not barcode:
+        return None
+    barcode = barcode.strip()
+    # 18 digits always fits in a signed BIGINT
+    if barcode.isascii() and barcode.isdigit() and len(barcode) <= 18:
+        return int(barcode)
+    return None
+
+
 class Category(Base):
     """Product categories from competitor apps."""
     __tablename__ = "categories"
 
     id = Column(Integer, primary_key=True)
-    source_app = Column(String(50), nullable=False)
+    source_app = Column(source_app_enum, nullable=False)
     external_id = Column(String(255), nullable=False)
     name = Column(String(500), nullable=False)
     name_ar = Column(String(500))
@@ -50,7 +94,7 @@ class Brand(Base):
     __tablename__ = "brands"
 
     id = Column(Integer, primary_key=True)
-    source_app = Column(String(50), nullable=False)
+    source_app = Column(source_app_enum, nullable=False)
     external_id = Column(String(255), nullable=False)
     name = Column(String(500), nullable=False)
     name_ar = Column(String(500))
@@ -73,7 +117,7 @@ class Product(Base):
     __tablename__ = "products"
 
     id = Column(Integer, primary_key=True)
-    source_app = Column(String(50), nullable=False)
+    source_app = Column(source_app_enum, nullable=False)
     external_id = Column(String(255), nullable=False)
     name = Column(String(1000), nullable=False)
     name_ar = Column(String(1000))
@@ -83,13 +127,22 @@ class Product(Base):
     brand_id = Column(Integer, ForeignKey("brands.id"))
     brand = Column(String(255))  # Legacy: external brand ID as string
     sku = Column(String(255))
-    barcode = Column(String(100))  # For cross-app product matching
+    barcode = Column(String(100))  # Raw barcode as returned by the API
+    barcode_num = Column(BigInteger)  # Numeric barcode for cross-app matching
     image_url = Column(Text)
     additional_images = Column(ARRAY(Text))
-    unit_type = Column(String(50), default="piece")
+    unit_type = Column(unit_type_enum, default=UnitType.PIECE.value)
     unit_value = Column(Numeric(10, 3))
     min_order_quantity = Column(Integer, default=1)
     extra_data = Column(JSONB)  # Flexible storage for app-specific data
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(name_ar, '') "
+            "|| ' ' || coalesce(brand, '') || ' ' || coalesce(sku, ''))",
+            persisted=True,
+        ),
+    )  # Precomputed at write time for full-text search
     is_active = Column(Boolean, default=True)
     first_seen_at = Column(DateTime(timezone=True), server_default=func.now())
     last_seen_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -109,11 +162,76 @@ class Product(Base):
     __table_args__ = (
         UniqueConstraint("source_app", "external_id", name="uq_product_source_external"),
         Index("idx_product_source", "source_app"),
-        Index("idx_product_barcode", "barcode"),
+        Index("idx_product_source_active", "source_app", postgresql_where=text("is_active")),
+        Index("idx_product_barcode_num", "barcode_num"),
         Index("idx_product_sku", "sku"),
         Index("idx_product_brand", "brand_id"),
+        Index("idx_product_fts", "search_vector", postgresql_using="gin"),
+        # Needs the pg_trgm extension; serves the ILIKE substring search
+        Index(
+            "idx_product_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
 
+    @validates("barcode")
+    def _sync_barcode_num(self, key, value):
+        """Keep the numeric barcode in step with the raw barcode."""
+        self.barcode_num = barcode_to_int(value)
+        return value
+
+    @classmethod
+    def barcode_matches(cls, barcode: str):
+        """Build a filter matching products that share a barcode.
+
+        Numeric barcodes are compared on the indexed integer column;
+        anything else falls back to raw string equality.
+
+        Args:
+            barcode: Barcode to match.
+
+        Returns:
+            SQL filter expression.
+        """
+        barcode_num = barcode_to_int(barcode)
+        if barcode_num is not None:
+            return cls.barcode_num == barcode_num
+        return cls.barcode == barcode
+
+    @classmethod
+    def barcode_key(cls):
+        """Build the expression products are grouped on for cross-app matching.
+
+        Follows the same rule as barcode_matches(): numeric barcodes are
+        keyed by their integer value, anything else by the raw string.
+
+        Returns:
+            SQL text expression; NULL for products without a barcode.
+        """
+        return func.coalesce(cast(cls.barcode_num, Text), func.nullif(cls.barcode, ""))
+
+    @classmethod
+    def search_matches(cls, query: str):
+        """Build a product search filter.
+
+        Whole words are matched through the full-text search vector (name,
+        Arabic name, brand and SKU). Substrings of the name, such as part of
+        a word or an Arabic word with an attached prefix (ال, و, ب), still
+        match through ILIKE, served by the trigram index.
+
+        Args:
+            query: User search text (web search syntax).
+
+        Returns:
+            SQL filter expression.
+        """
+        return or_(
+            cls.search_vector.op("@@")(func.websearch_to_tsquery("simple", query)),
+            cls.name.icontains(query, autoescape=True),
+        )
+
     @property
     def latest_price(self):
         """Get the most recent price record."""
@@ -128,13 +246,13 @@ class PriceRecord(Base):
 
     id = Column(Integer, primary_key=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
-    source_app = Column(String(50), nullable=False)
+    source_app = Column(source_app_enum, nullable=False)
     price = Column(Numeric(12, 2), nullable=False)
     original_price = Column(Numeric(12, 2))  # Price before discount
     discount_percentage = Column(Numeric(5, 2))
     currency = Column(String(10), default="EGP")
     is_available = Column(Boolean, default=True)
-    stock_status = Column(String(100))  # in_stock, out_of_stock, limited
+    stock_status = Column(stock_status_enum)
     recorded_at = Column(DateTime(timezone=True), server_default=func.now())
     scrape_job_id = Column(Integer, ForeignKey("scrape_jobs.id"))
 
@@ -153,7 +271,7 @@ class Offer(Base):
     __tablename__ = "offers"
 
     id = Column(Integer, primary_key=True)
-    source_app = Column(String(50), nullable=False)
+    source_app = Column(source_app_enum, nullable=False)
     external_id = Column(String(255), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"))
     title = Column(String(500), nullable=False)
@@ -178,7 +296,7 @@ class Offer(Base):
 
     __table_args__ = (
         UniqueConstraint("source_app", "external_id", name="uq_offer_source_external"),
-        Index("idx_offer_active", "is_active", "end_date"),
+        Index("idx_offer_active", "end_date", postgresql_where=text("is_active")),
     )
 
 
@@ -187,9 +305,9 @@ class ScrapeJob(Base):
     __tablename__ = "scrape_jobs"
 
     id = Column(Integer, primary_key=True)
-    source_app = Column(String(50), nullable=False)
-    job_type = Column(String(50), nullable=False)  # full, incremental, categories, offers
-    status = Column(String(50), default="pending")  # pending, running, completed, failed
+    source_app = Column(source_app_enum, nullable=False)
+    job_type = Column(job_type_enum, nullable=False)
+    status = Column(job_status_enum, default=JobStatus.PENDING.value)
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     products_scraped = Column(Integer, default=0)
@@ -207,13 +325,49 @@ class ScrapeJob(Base):
         Index("idx_scrape_job_source_status", "source_app", "status"),
     )
 
+    @classmethod
+    async def bump(
+        cls,
+        session,
+        job_id: int,
+        *,
+        scraped: int = 0,
+        updated: int = 0,
+        new: int = 0,
+        errors: int = 0,
+    ) -> None:
+        """Atomically add to the job's progress counters.
+
+        Issues a single UPDATE ... SET col = col + n, so concurrent
+        writers never lose increments and no SELECT is needed first.
+
+        Args:
+            session: AsyncSession instance.
+            job_id: Scrape job ID.
+            scraped: Products scraped to add.
+            updated: Products updated to add.
+            new: New products to add.
+            errors: Errors to add.
+        """
+        await session.execute(
+            update(cls)
+            .where(cls.id == job_id)
+            .values(
+                products_scraped=cls.products_scraped + scraped,
+                products_updated=cls.products_updated + updated,
+                products_new=cls.products_new + new,
+                errors_count=cls.errors_count + errors,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
 
 class Credential(Base):
     """Encrypted credentials for app authentication."""
     __tablename__ = "credentials"
 
     id = Column(Integer, primary_key=True)
-    source_app = Column(String(50), nullable=False, unique=True)
+    source_app = Column(source_app_enum, nullable=False)
     username = Column(String(255), nullable=False)
     password_encrypted = Column(Text, nullable=False)  # Encrypted with Fernet
     access_token = Column(Text)
@@ -225,3 +379,13 @@ class Credential(Base):
     last_login_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        # One active credential per app; lookups hit this index directly
+        Index(
+            "uq_credential_source_active",
+            "source_app",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
@@ -1,20 +1,40 @@
 """Enumerations used across the application."""
 from enum import Enum
+from typing import Optional
 
 
-class SourceApp(str, Enum):
+class ValueEnum(str, Enum):
+    """String enum with exception-free lookup by value."""
+
+    @classmethod
+    def try_parse(cls, value) -> Optional["ValueEnum"]:
+        """Look up a member by value without raising.
+
+        Args:
+            value: Raw value to look up.
+
+        Returns:
+            Matching member, or None if the value is unknown.
+        """
+        try:
+            return cls._value2member_map_.get(value)
+        except TypeError:  # Unhashable input
+            return None
+
+
+class SourceApp(ValueEnum):
     """Supported competitor apps."""
     TAGER_ELSAADA = "tager_elsaada"
     BEN_SOLIMAN = "ben_soliman"
 
 
-class Currency(str, Enum):
+class Currency(ValueEnum):
     """Supported currencies."""
     EGP = "EGP"
     USD = "USD"
 
 
-class UnitType(str, Enum):
+class UnitType(ValueEnum):
     """Product unit types."""
     PIECE = "piece"
     KG = "kg"
@@ -26,7 +46,7 @@ class UnitType(str, Enum):
     CARTON = "carton"
 
 
-class JobStatus(str, Enum):
+class JobStatus(ValueEnum):
     """Scrape job statuses."""
     PENDING = "pending"
     RUNNING = "running"
@@ -34,7 +54,7 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
-class JobType(str, Enum):
+class JobType(ValueEnum):
     """Types of scrape jobs."""
     FULL = "full"
     INCREMENTAL = "incremental"
@@ -42,9 +62,10 @@ class JobType(str, Enum):
     OFFERS = "offers"
 
 
-class StockStatus(str, Enum):
+class StockStatus(ValueEnum):
     """Product stock statuses."""
     IN_STOCK = "in_stock"
     OUT_OF_STOCK = "out_of_stock"
     LIMITED = "limited"
     UNKNOWN = "unknown"
+
@@ -2,61 +2,14 @@
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List, Any, Dict
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 
 from .enums import SourceApp, Currency, UnitType, StockStatus
 
-
-# ============== API Response Schemas ==============
-# These schemas represent raw API responses - adjust after API discovery
-
-class ProductAPIResponse(BaseModel):
-    """Schema for raw product API response.
-
-    NOTE: This is a placeholder. Update fields after API discovery.
-    """
-    id: str
-    name: str
-    name_ar: Optional[str] = None
-    description: Optional[str] = None
-    description_ar: Optional[str] = None
-    category_id: Optional[str] = None
-    category_name: Optional[str] = None
-    brand: Optional[str] = None
-    sku: Optional[str] = None
-    barcode: Optional[str] = None
-    image_url: Optional[str] = None
-    images: Optional[List[str]] = None
-    price: Decimal
-    original_price: Optional[Decimal] = None
-    discount_percentage: Optional[Decimal] = None
-    unit: Optional[str] = None
-    min_order_quantity: Optional[int] = 1
-    stock_status: Optional[str] = None
-    is_available: bool = True
-
-
-class CategoryAPIResponse(BaseModel):
-    """Schema for raw category API response."""
-    id: str
-    name: str
-    name_ar: Optional[str] = None
-    parent_id: Optional[str] = None
-    image_url: Optional[str] = None
-    sort_order: Optional[int] = None
-
-
-class OfferAPIResponse(BaseModel):
-    """Schema for raw offer API response."""
-    id: str
-    title: str
-    title_ar: Optional[str] = None
-    description: Optional[str] = None
-    product_id: Optional[str] = None
-    discount_type: Optional[str] = None
-    discount_value: Optional[Decimal] = None
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
+# Shared config: schemas are immutable value objects, never re-validated
+# on assignment, and silently drop unknown fields.
+SCHEMA_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
 
 
 # ============== Domain Models ==============
@@ -64,6 +17,8 @@ class OfferAPIResponse(BaseModel):
 
 class CategoryCreate(BaseModel):
     """Schema for creating a category."""
+    model_config = SCHEMA_CONFIG
+
     source_app: SourceApp
     external_id: str
     name: str
@@ -75,6 +30,8 @@ class CategoryCreate(BaseModel):
 
 class ProductCreate(BaseModel):
     """Schema for creating a product."""
+    model_config = SCHEMA_CONFIG
+
     source_app: SourceApp
     external_id: str
     name: str
@@ -93,10 +50,16 @@ class ProductCreate(BaseModel):
     unit_value: Optional[Decimal] = None
     min_order_quantity: int = 1
     extra_data: Optional[Dict[str, Any]] = None
+    # Scraped price snapshot, recorded separately as a PriceRecord
+    current_price: Optional[Decimal] = None
+    original_price: Optional[Decimal] = None
+    is_available: bool = True
 
 
 class PriceRecordCreate(BaseModel):
     """Schema for creating a price record."""
+    model_config = SCHEMA_CONFIG
+
     product_id: int
     source_app: SourceApp
     price: Decimal
@@ -106,16 +69,11 @@ class PriceRecordCreate(BaseModel):
     is_available: bool = True
     stock_status: Optional[StockStatus] = None
 
-    @field_validator("price", "original_price", "discount_percentage", mode="before")
-    @classmethod
-    def convert_to_decimal(cls, v):
-        if v is not None:
-            return Decimal(str(v))
-        return v
-
 
 class OfferCreate(BaseModel):
     """Schema for creating an offer."""
+    model_config = SCHEMA_CONFIG
+
     source_app: SourceApp
     external_id: str
     product_id: Optional[int] = None
@@ -134,9 +92,13 @@ class OfferCreate(BaseModel):
 
 
 # ============== Response/Report Models ==============
+# Built once and serialized once, so these are slotted frozen dataclasses
+# that orjson can serialize directly (see src.utils.serialization.dumps).
 
-class PriceHistoryItem(BaseModel):
+@dataclass(frozen=True, slots=True, config=SCHEMA_CONFIG)
+class PriceHistoryItem:
     """Single price history entry."""
+
     price: Decimal
     original_price: Optional[Decimal]
     discount_percentage: Optional[Decimal]
@@ -144,8 +106,10 @@ class PriceHistoryItem(BaseModel):
     is_available: bool
 
 
-class ProductWithPriceHistory(BaseModel):
+@dataclass(frozen=True, slots=True, config=SCHEMA_CONFIG)
+class ProductWithPriceHistory:
     """Product with its price history."""
+
     id: int
     source_app: SourceApp
     external_id: str
@@ -157,8 +121,10 @@ class ProductWithPriceHistory(BaseModel):
     brand: Optional[str]
 
 
-class PriceComparisonItem(BaseModel):
+@dataclass(frozen=True, slots=True, config=SCHEMA_CONFIG)
+class PriceComparisonItem:
     """Price comparison between apps."""
+
     product_name: str
     product_name_ar: Optional[str]
     barcode: Optional[str]
@@ -170,6 +136,8 @@ class PriceComparisonItem(BaseModel):
 
 class ScrapeJobSummary(BaseModel):
     """Summary of a scrape job."""
+    model_config = ConfigDict(**SCHEMA_CONFIG, from_attributes=True)
+
     id: int
     source_app: SourceApp
     job_type: str
@@ -180,7 +148,6 @@ class ScrapeJobSummary(BaseModel):
     products_updated: int
     products_new: int
     errors_count: int
+    error_details: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
     duration_seconds: Optional[float] = None
-
-    class Config:
-        from_attributes = True
@@ -3,7 +3,7 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 
-from src.database.connection import get_async_session
+from src.database.connection import get_async_session, get_engine
 from src.scrapers.tager_elsaada import TagerElsaadaScraper
 from src.scrapers.ben_soliman import BenSolimanScraper
 from src.scrapers.auth.token_manager import TokenManager
@@ -49,6 +49,22 @@ async def scrape_ben_soliman() -> None:
                 raise
 
 
+async def _check_token(source: SourceApp) -> bool:
+    """Check whether a source's token needs refreshing.
+
+    Uses its own session so checks for different sources can run
+    concurrently (an AsyncSession does not allow concurrent queries).
+
+    Args:
+        source: Source application.
+
+    Returns:
+        True if refresh is needed.
+    """
+    async with get_async_session() as session:
+        return await TokenManager(session).refresh_if_needed(source)
+
+
 async def refresh_tokens() -> None:
     """Refresh authentication tokens before expiry.
 
@@ -57,19 +73,20 @@ async def refresh_tokens() -> None:
     """
     logger.info("Starting token refresh job")
 
-    async with get_async_session() as session:
-        token_manager = TokenManager(session)
-
-        for source in [SourceApp.TAGER_ELSAADA, SourceApp.BEN_SOLIMAN]:
-            try:
-                needs_refresh = await token_manager.refresh_if_needed(source)
-                if needs_refresh:
-                    logger.info(f"Token needs refresh for {source.value}")
-                    # Token refresh will happen automatically on next scrape
-                else:
-                    logger.debug(f"Token still valid for {source.value}")
-            except Exception as e:
-                logger.error(f"Token check failed for {source.value}: {e}")
+    sources = list(SourceApp)
+    results = await asyncio.gather(
+        *(_check_token(source) for source in sources),
+        return_exceptions=True,
+    )
+
+    for source, result in zip(sources, results):
+        if isinstance(result, Exception):
+            logger.error(f"Token check failed for {source.value}: {result}")
+        elif result:
+            logger.info(f"Token needs refresh for {source.value}")
+            # Token refresh will happen automatically on next scrape
+        else:
+            logger.debug(f"Token still valid for {source.value}")
 
 
 async def cleanup_old_data() -> None:
@@ -104,10 +121,10 @@ async def health_check() -> None:
     logger.debug("Running health check")
 
     try:
-        # Check database
-        async with get_async_session() as session:
-            # Simple query to verify connection
-            await session.execute("SELECT 1")
+        # Short-lived pooled connection; asyncpg caches the prepared
+        # SELECT 1 per connection, so a tick holds nothing between runs
+        async with get_engine().connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
             logger.debug("Database connection OK")
 
     except Exception as e:
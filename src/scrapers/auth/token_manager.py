@@ -1,7 +1,9 @@
 """Token management for app authentication."""
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Dict
 from cryptography.fernet import Fernet
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,9 +15,27 @@ from src.models.enums import SourceApp
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_fernet(encryption_key: str) -> Optional[Fernet]:
+    """Get a shared Fernet instance for the configured key.
+
+    Args:
+        encryption_key: Fernet key from settings.
+
+    Returns:
+        Fernet instance, or None if no key is configured.
+    """
+    if not encryption_key:
+        return None
+    return Fernet(encryption_key.encode())
+
+
 class TokenManager:
     """Manages authentication tokens for competitor apps."""
 
+    # Treat tokens as expired this many seconds early
+    EXPIRY_BUFFER_SECONDS = 300.0
+
     def __init__(self, session: AsyncSession):
         """Initialize token manager.
 
@@ -23,9 +43,26 @@ class TokenManager:
             session: Database session for credential storage.
         """
         self.session = session
-        self._fernet = None
-        if settings.encryption_key:
-            self._fernet = Fernet(settings.encryption_key.encode())
+        self._fernet = _get_fernet(settings.encryption_key)
+        # Credentials loaded through this manager's session, by source
+        self._credential_cache: Dict[SourceApp, Credential] = {}
+        # Token expiry as epoch seconds, by source
+        self._expiry_cache: Dict[SourceApp, Optional[float]] = {}
+
+    def _get_expiry_ts(self, source_app: SourceApp, credential: Credential) -> Optional[float]:
+        """Get the token expiry as an epoch timestamp.
+
+        Args:
+            source_app: Source application.
+            credential: Loaded credential for the app.
+
+        Returns:
+            Expiry in epoch seconds, or None if the token doesn't expire.
+        """
+        if source_app not in self._expiry_cache:
+            expires_at = credential.token_expires_at
+            self._expiry_cache[source_app] = expires_at.timestamp() if expires_at else None
+        return self._expiry_cache[source_app]
 
     def _encrypt(self, value: str) -> str:
         """Encrypt a value.
@@ -56,19 +93,31 @@ class TokenManager:
     async def get_credential(self, source_app: SourceApp) -> Optional[Credential]:
         """Get stored credential for an app.
 
+        Results are cached for the lifetime of this manager (one session),
+        so repeated token checks don't re-query the same row.
+
         Args:
             source_app: Source application.
 
         Returns:
             Credential or None if not found.
         """
+        cached = self._credential_cache.get(source_app)
+        if cached is not None:
+            return cached
+
         result = await self.session.execute(
-            select(Credential).where(
+            select(Credential)
+            .where(
                 Credential.source_app == source_app.value,
-                Credential.is_active == True,
+                Credential.is_active.is_(True),
             )
+            .limit(1)
         )
-        return result.scalar_one_or_none()
+        credential = result.scalars().first()
+        if credential is not None:
+            self._credential_cache[source_app] = credential
+        return credential
 
     async def store_credential(
         self,
@@ -107,6 +156,7 @@ class TokenManager:
             )
             self.session.add(credential)
             await self.session.flush()
+            self._credential_cache[source_app] = credential
             return credential
 
     async def store_tokens(
@@ -133,8 +183,10 @@ class TokenManager:
 
         credential.access_token = access_token
         credential.refresh_token = refresh_token
-        credential.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in_seconds)
-        credential.last_login_at = datetime.utcnow()
+        now = datetime.now(timezone.utc)
+        credential.token_expires_at = now + timedelta(seconds=expires_in_seconds)
+        credential.last_login_at = now
+        self._expiry_cache[source_app] = credential.token_expires_at.timestamp()
 
         if additional_headers:
             credential.additional_headers = additional_headers
@@ -156,7 +208,8 @@ class TokenManager:
             return None
 
         # Check if expired
-        if credential.token_expires_at and credential.token_expires_at < datetime.utcnow():
+        expires_ts = self._get_expiry_ts(source_app, credential)
+        if expires_ts is not None and expires_ts < time.time():
             logger.warning(f"Token expired for {source_app.value}")
             return None
 
@@ -175,12 +228,11 @@ class TokenManager:
         if not credential or not credential.access_token:
             return False
 
-        if not credential.token_expires_at:
+        expires_ts = self._get_expiry_ts(source_app, credential)
+        if expires_ts is None:
             return True
 
-        # Add 5 minute buffer
-        buffer = timedelta(minutes=5)
-        return credential.token_expires_at > (datetime.utcnow() + buffer)
+        return expires_ts > time.time() + self.EXPIRY_BUFFER_SECONDS
 
     async def get_password(self, source_app: SourceApp) -> Optional[str]:
         """Get decrypted password for an app.
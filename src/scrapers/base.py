@@ -1,9 +1,11 @@
 """Base scraper class with common functionality."""
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from decimal import Decimal
+from types import MappingProxyType
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +23,9 @@ from src.scrapers.auth.token_manager import TokenManager
 
 logger = logging.getLogger(__name__)
 
+# Precision of stored discount percentages
+_CENT = Decimal("0.01")
+
 
 class BaseScraper(ABC):
     """Abstract base class for competitor app scrapers.
@@ -33,6 +38,29 @@ class BaseScraper(ABC):
     SOURCE_APP: SourceApp = None
     BASE_URL: str = ""
 
+    # msgspec type the product list endpoint is decoded into. The decoder
+    # is built once per type and reused; None falls back to untyped JSON.
+    PRODUCTS_RESPONSE_TYPE: Any = None
+
+    # Number of products upserted per statement; job progress counters
+    # are written after each batch
+    PRODUCT_BATCH_SIZE: int = 500
+
+    # Number of buffered price records written per bulk insert
+    PRICE_BATCH_SIZE: int = 10000
+
+    # Initial job statistics, copied per job
+    _ZERO_STATS = MappingProxyType({
+        "products_scraped": 0,
+        "products_new": 0,
+        "products_updated": 0,
+        "errors": 0,
+    })
+
+    # Fetched products waiting to be written; bounds memory while the
+    # fetcher runs ahead of the database
+    PRODUCT_QUEUE_SIZE: int = 512
+
     def __init__(self, session: AsyncSession):
         """Initialize the scraper.
 
@@ -57,14 +85,14 @@ class BaseScraper(ABC):
         # HTTP client will be initialized in context manager
         self._client: Optional[AsyncAPIClient] = None
         self._current_job: Optional[ScrapeJob] = None
+        self._pending_products: List[ProductCreate] = []
+        # Last recorded (price, is_available) by product_id
+        self._price_cache: Dict[int, tuple] = {}
+        self._pending_prices: List[PriceRecordCreate] = []
 
         # Statistics
-        self._stats = {
-            "products_scraped": 0,
-            "products_new": 0,
-            "products_updated": 0,
-            "errors": 0,
-        }
+        self._stats = dict(self._ZERO_STATS)
+        self._flushed_stats = dict(self._ZERO_STATS)
 
     async def __aenter__(self):
         """Enter async context and initialize HTTP client."""
@@ -118,6 +146,9 @@ class BaseScraper(ABC):
     def parse_product(self, raw_data: Dict[str, Any]) -> ProductCreate:
         """Parse raw API response into ProductCreate schema.
 
+        Implementations also fill the scraped price fields
+        (current_price, original_price, is_available).
+
         Args:
             raw_data: Raw product data from API.
 
@@ -140,6 +171,19 @@ class BaseScraper(ABC):
 
     # ============== Common Methods ==============
 
+    async def iter_products(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream raw products as they are fetched.
+
+        The default implementation yields the result of fetch_products().
+        Subclasses with paginated APIs should override this to yield each
+        page as soon as it arrives.
+
+        Yields:
+            Raw product data dictionaries.
+        """
+        for product_data in await self.fetch_products():
+            yield product_data
+
     async def ensure_authenticated(self) -> None:
         """Ensure we have a valid authentication token.
 
@@ -177,22 +221,51 @@ class BaseScraper(ABC):
             source_app=self.SOURCE_APP.value,
             job_type=job_type.value,
             status=JobStatus.RUNNING.value,
-            started_at=datetime.utcnow(),
+            started_at=datetime.now(timezone.utc),
         )
         self.session.add(job)
         await self.session.flush()
 
         self._current_job = job
-        self._stats = {
-            "products_scraped": 0,
-            "products_new": 0,
-            "products_updated": 0,
-            "errors": 0,
-        }
+        self._stats = dict(self._ZERO_STATS)
+        self._flushed_stats = dict(self._ZERO_STATS)
 
         logger.info(f"Started {job_type.value} scrape job #{job.id} for {self.SOURCE_APP.value}")
         return job
 
+    async def _flush_prices(self) -> None:
+        """Bulk insert buffered price records."""
+        if not self._pending_prices:
+            return
+
+        pending, self._pending_prices = self._pending_prices, []
+        await self.price_repo.bulk_insert_prices(
+            pending,
+            scrape_job_id=self._current_job.id if self._current_job else None,
+        )
+
+    async def _flush_progress(self) -> None:
+        """Write counter deltas since the last flush to the current job."""
+        if not self._current_job:
+            return
+
+        delta = {
+            key: self._stats[key] - self._flushed_stats[key]
+            for key in self._stats
+        }
+        if not any(delta.values()):
+            return
+
+        await ScrapeJob.bump(
+            self.session,
+            self._current_job.id,
+            scraped=delta["products_scraped"],
+            updated=delta["products_updated"],
+            new=delta["products_new"],
+            errors=delta["errors"],
+        )
+        self._flushed_stats = dict(self._stats)
+
     async def _finish_job(self, status: JobStatus, error_details: dict = None) -> None:
         """Finish the current scrape job.
 
@@ -203,12 +276,10 @@ class BaseScraper(ABC):
         if not self._current_job:
             return
 
+        await self._flush_progress()
+
         self._current_job.status = status.value
-        self._current_job.completed_at = datetime.utcnow()
-        self._current_job.products_scraped = self._stats["products_scraped"]
-        self._current_job.products_new = self._stats["products_new"]
-        self._current_job.products_updated = self._stats["products_updated"]
-        self._current_job.errors_count = self._stats["errors"]
+        self._current_job.completed_at = datetime.now(timezone.utc)
         self._current_job.error_details = error_details
 
         await self.session.flush()
@@ -221,52 +292,67 @@ class BaseScraper(ABC):
             f"Errors: {self._stats['errors']}"
         )
 
-    async def process_product(
-        self,
-        raw_data: Dict[str, Any],
-        price: Decimal,
-        original_price: Decimal = None,
-        is_available: bool = True,
-    ) -> None:
-        """Process a single product from API response.
+    async def process_product(self, product_data: ProductCreate) -> None:
+        """Process a single parsed product.
+
+        The product is buffered; buffered products are written in batches
+        by _flush_products().
 
         Args:
-            raw_data: Raw product data.
-            price: Current price.
-            original_price: Original price before discount.
-            is_available: Product availability.
+            product_data: Parsed product, including its scraped price.
         """
-        try:
-            # Parse product data
-            product_data = self.parse_product(raw_data)
+        self._pending_products.append(product_data)
+        if len(self._pending_products) >= self.PRODUCT_BATCH_SIZE:
+            await self._flush_products()
+
+    async def _flush_products(self) -> None:
+        """Upsert buffered products in one statement and queue their prices.
 
-            # Upsert product
-            product, is_new = await self.product_repo.upsert(product_data)
+        Each batch runs in a savepoint. If the batch fails it is rolled
+        back and retried one product at a time, so only the products that
+        fail on their own are counted as errors and skipped.
+        """
+        if not self._pending_products:
+            return
 
-            # Check if we should record price
-            should_record = await self.price_repo.should_record_price(
-                product.id, price, is_available
+        pending, self._pending_products = self._pending_products, []
+
+        try:
+            async with self.session.begin_nested():
+                upserted = await self.product_repo.upsert_many(pending)
+        except Exception as e:
+            logger.warning(
+                f"Upserting {len(pending)} products failed, retrying one by one: {e}"
             )
+            pending, upserted = await self._upsert_individually(pending)
+
+        for product_data in pending:
+            product_id, is_new = upserted[
+                (product_data.source_app.value, product_data.external_id)
+            ]
+            price = product_data.current_price
+            original_price = product_data.original_price
+            is_available = product_data.is_available
+
+            # Only record a price if one was scraped and price or
+            # availability changed
+            if price is not None and self._price_cache.get(product_id) != (price, is_available):
+                self._price_cache[product_id] = (price, is_available)
 
-            if should_record:
                 # Calculate discount percentage
                 discount_pct = None
                 if original_price and original_price > price:
-                    discount_pct = ((original_price - price) / original_price * 100).quantize(Decimal("0.01"))
+                    discount_pct = ((original_price - price) / original_price * 100).quantize(_CENT)
 
-                price_record = PriceRecordCreate(
-                    product_id=product.id,
+                self._pending_prices.append(PriceRecordCreate(
+                    product_id=product_id,
                     source_app=self.SOURCE_APP,
                     price=price,
                     original_price=original_price,
                     discount_percentage=discount_pct,
                     currency=Currency.EGP,
                     is_available=is_available,
-                )
-                await self.price_repo.create(
-                    price_record,
-                    scrape_job_id=self._current_job.id if self._current_job else None,
-                )
+                ))
 
             # Update stats
             self._stats["products_scraped"] += 1
@@ -275,9 +361,40 @@ class BaseScraper(ABC):
             else:
                 self._stats["products_updated"] += 1
 
-        except Exception as e:
-            logger.error(f"Error processing product: {e}", exc_info=True)
-            self._stats["errors"] += 1
+        if len(self._pending_prices) >= self.PRICE_BATCH_SIZE:
+            await self._flush_prices()
+
+        await self._flush_progress()
+
+    async def _upsert_individually(
+        self, products: List[ProductCreate]
+    ) -> Tuple[List[ProductCreate], Dict[Tuple[str, str], Tuple[int, bool]]]:
+        """Upsert products one at a time, each in its own savepoint.
+
+        Args:
+            products: Products of a batch whose bulk upsert failed.
+
+        Returns:
+            The products that were written, and their upsert results keyed
+            like ProductRepository.upsert_many().
+        """
+        written: List[ProductCreate] = []
+        upserted: Dict[Tuple[str, str], Tuple[int, bool]] = {}
+
+        for product_data in products:
+            try:
+                async with self.session.begin_nested():
+                    upserted.update(await self.product_repo.upsert_many([product_data]))
+            except Exception as e:
+                logger.error(
+                    f"Error upserting product {product_data.external_id}: {e}",
+                    exc_info=True,
+                )
+                self._stats["errors"] += 1
+                continue
+            written.append(product_data)
+
+        return written, upserted
 
     async def run_full_scrape(self) -> None:
         """Run a full scrape of all products.
@@ -287,39 +404,40 @@ class BaseScraper(ABC):
         await self._start_job(JobType.FULL)
 
         try:
+            self._price_cache = await self.price_repo.load_latest_snapshot(self.SOURCE_APP)
+
             # Ensure we're authenticated
             await self.ensure_authenticated()
 
             # Add startup delay
             await RequestJitter.wait_session_start()
 
-            # Fetch and process categories
-            logger.info(f"Fetching categories for {self.SOURCE_APP.value}")
-            categories = await self.fetch_categories()
-
-            for cat_data in categories:
-                category_schema = self.parse_category(cat_data)
-                await self.category_repo.upsert(category_schema)
-
-            logger.info(f"Processed {len(categories)} categories")
-
-            # Fetch and process products
+            # Start fetching products right away; the fetcher runs ahead in
+            # a separate task so network and database I/O overlap, including
+            # while categories are being stored
             logger.info(f"Fetching products for {self.SOURCE_APP.value}")
-            products = await self.fetch_products()
-
-            for product_data in products:
-                # Extract price from raw data - subclass should handle this
-                price = Decimal(str(product_data.get("price", 0)))
-                original_price = None
-                if product_data.get("original_price"):
-                    original_price = Decimal(str(product_data["original_price"]))
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.PRODUCT_QUEUE_SIZE)
+            producer = asyncio.create_task(self._produce_products(queue))
 
-                is_available = product_data.get("is_available", True)
+            try:
+                # Fetch and process categories
+                logger.info(f"Fetching categories for {self.SOURCE_APP.value}")
+                categories = await self.fetch_categories()
 
-                await self.process_product(
-                    product_data, price, original_price, is_available
+                await self.category_repo.upsert_many(
+                    [self.parse_category(cat_data) for cat_data in categories]
                 )
 
+                logger.info(f"Processed {len(categories)} categories")
+
+                await self._consume_products(queue)
+            except BaseException:
+                producer.cancel()
+                raise
+            await producer  # Surface fetch errors
+
+            await self._flush_products()
+            await self._flush_prices()
             await self._finish_job(JobStatus.COMPLETED)
 
         except Exception as e:
@@ -329,3 +447,36 @@ class BaseScraper(ABC):
                 error_details={"error": str(e), "type": type(e).__name__},
             )
             raise
+
+    async def _produce_products(self, queue: asyncio.Queue) -> None:
+        """Feed fetched products into the queue, then a None sentinel.
+
+        Args:
+            queue: Queue drained by _consume_products().
+        """
+        try:
+            async for product_data in self.iter_products():
+                await queue.put(product_data)
+        finally:
+            # Unblock the consumer, unless it is gone and cancelled us
+            if not asyncio.current_task().cancelling():
+                await queue.put(None)
+
+    async def _consume_products(self, queue: asyncio.Queue) -> None:
+        """Process queued products until the sentinel arrives.
+
+        A single consumer is used because all writes share this
+        scraper's session, which doesn't allow concurrent operations.
+
+        Args:
+            queue: Queue filled by _produce_products().
+        """
+        while (raw_data := await queue.get()) is not None:
+            try:
+                product_data = self.parse_product(raw_data)
+            except Exception as e:
+                logger.error(f"Error processing product: {e}", exc_info=True)
+                self._stats["errors"] += 1
+                continue
+
+            await self.process_product(product_data)
@@ -2,17 +2,47 @@
 
 API Discovery completed 2026-01-12 via tcpdump traffic capture.
 """
+import asyncio
 import logging
+from itertools import chain
 from typing import List, Dict, Any, Optional
-from decimal import Decimal
 
 from src.scrapers.base import BaseScraper
+from src.models.api_schemas import ItemsEnvelope, ItemsResponse
 from src.models.schemas import ProductCreate, CategoryCreate
 from src.models.enums import SourceApp, UnitType
 from src.config.settings import settings
+from src.utils.serialization import to_decimal
 
 logger = logging.getLogger(__name__)
 
+# Product and category images are served from the image host
+_ICON_URL_PREFIX = "http://37.148.206.212/Icons/"
+
+# Unit names as returned by the Ben Soliman API (lowercased)
+_UNIT_MAPPING = {
+    "piece": UnitType.PIECE,
+    "pcs": UnitType.PIECE,
+    "unit": UnitType.PIECE,
+    "قطعة": UnitType.PIECE,
+    "kg": UnitType.KG,
+    "kilo": UnitType.KG,
+    "كيلو": UnitType.KG,
+    "gram": UnitType.GRAM,
+    "g": UnitType.GRAM,
+    "جرام": UnitType.GRAM,
+    "liter": UnitType.LITER,
+    "l": UnitType.LITER,
+    "لتر": UnitType.LITER,
+    "ml": UnitType.ML,
+    "pack": UnitType.PACK,
+    "عبوة": UnitType.PACK,
+    "box": UnitType.BOX,
+    "علبة": UnitType.BOX,
+    "carton": UnitType.CARTON,
+    "كرتونة": UnitType.CARTON,
+}
+
 
 class BenSolimanScraper(BaseScraper):
     """Scraper for Ben Soliman wholesale app.
@@ -45,6 +75,9 @@ class BenSolimanScraper(BaseScraper):
         "domains": "/customer_app/api/v2/domains",  # On secondary server
     }
 
+    # Response format: {"data": [...]} (sometimes the bare array)
+    PRODUCTS_RESPONSE_TYPE = ItemsResponse
+
     # Required headers for Ben Soliman API
     DEFAULT_HEADERS = {
         "user-agent": "Dart/3.9 (dart:io)",
@@ -74,8 +107,7 @@ class BenSolimanScraper(BaseScraper):
         cached_token = await self.token_manager.get_access_token(self.SOURCE_APP)
         if cached_token:
             self._client.set_auth_token(cached_token)
-            for key, value in self.DEFAULT_HEADERS.items():
-                self._client.set_header(key, value)
+            self._client.set_extra_headers(self.DEFAULT_HEADERS)
             logger.info("Using cached authentication token for Ben Soliman")
             return True
 
@@ -89,7 +121,7 @@ class BenSolimanScraper(BaseScraper):
                     "Mob": credential.username,
                     "Password": password,
                 },
-                headers=self.DEFAULT_HEADERS,
+                extra_headers=self.DEFAULT_HEADERS,
             )
 
             # Extract token from response
@@ -107,8 +139,7 @@ class BenSolimanScraper(BaseScraper):
                     expires_in_seconds=315360000,  # ~10 years
                 )
                 self._client.set_auth_token(access_token)
-                for key, value in self.DEFAULT_HEADERS.items():
-                    self._client.set_header(key, value)
+                self._client.set_extra_headers(self.DEFAULT_HEADERS)
                 logger.info("Successfully authenticated with Ben Soliman")
                 return True
 
@@ -128,7 +159,7 @@ class BenSolimanScraper(BaseScraper):
         try:
             response = await self._client.get(
                 self.ENDPOINTS["domains"],
-                headers=self.DEFAULT_HEADERS,
+                extra_headers=self.DEFAULT_HEADERS,
             )
             return response if isinstance(response, list) else response.get("data", [])
         except Exception as e:
@@ -151,7 +182,7 @@ class BenSolimanScraper(BaseScraper):
             response = await self._client.get(
                 self.ENDPOINTS["categories"],
                 params={"domain_id": domain_id},
-                headers=self.DEFAULT_HEADERS,
+                extra_headers=self.DEFAULT_HEADERS,
             )
 
             # Response format: {"categories": [...]}
@@ -160,7 +191,7 @@ class BenSolimanScraper(BaseScraper):
             if isinstance(raw_categories, list):
                 categories = raw_categories
 
-            logger.info(f"Fetched {len(categories)} categories from Ben Soliman")
+            logger.info("Fetched %d categories from Ben Soliman", len(categories))
 
         except Exception as e:
             logger.error(f"Failed to fetch categories: {e}")
@@ -186,7 +217,7 @@ class BenSolimanScraper(BaseScraper):
                     "domain_id": domain_id,
                     "section_id": section_id,
                 },
-                headers=self.DEFAULT_HEADERS,
+                extra_headers=self.DEFAULT_HEADERS,
             )
             return response
         except Exception as e:
@@ -207,31 +238,42 @@ class BenSolimanScraper(BaseScraper):
         Returns:
             List of product data dictionaries.
         """
-        products = []
-        domain_id = domain_id or self.DEFAULT_DOMAIN_ID
-
         try:
-            params = {"domain_id": domain_id}
-            if category_id:
-                params["category_id"] = category_id
+            return await self._fetch_products(category_id, domain_id)
+        except Exception as e:
+            logger.error(f"Failed to fetch products: {e}")
+            return []
 
-            response = await self._client.get(
-                self.ENDPOINTS["items"],
-                params=params,
-                headers=self.DEFAULT_HEADERS,
-            )
+    async def _fetch_products(
+        self,
+        category_id: int = None,
+        domain_id: int = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch products (items), raising on failure.
 
-            # Response format: {"data": [...]}
-            raw_products = response.get("data", []) if isinstance(response, dict) else response
+        Args:
+            category_id: Category ID to filter by (optional)
+            domain_id: Domain/region ID
 
-            if isinstance(raw_products, list):
-                products = raw_products
+        Returns:
+            List of product data dictionaries.
+        """
+        domain_id = domain_id or self.DEFAULT_DOMAIN_ID
 
-            logger.info(f"Fetched {len(products)} products from Ben Soliman")
+        params = {"domain_id": domain_id}
+        if category_id:
+            params["category_id"] = category_id
 
-        except Exception as e:
-            logger.error(f"Failed to fetch products: {e}")
+        # Only "data" is decoded
+        response = await self._client.get(
+            self.ENDPOINTS["items"],
+            params=params,
+            extra_headers=self.DEFAULT_HEADERS,
+            response_type=self.PRODUCTS_RESPONSE_TYPE,
+        )
+        products = response.data if isinstance(response, ItemsEnvelope) else response
 
+        logger.info("Fetched %d products from Ben Soliman", len(products))
         return products
 
     async def fetch_all_products(self, domain_id: int = None) -> List[Dict[str, Any]]:
@@ -243,22 +285,47 @@ class BenSolimanScraper(BaseScraper):
         Returns:
             List of all product data dictionaries.
         """
-        all_products = []
         domain_id = domain_id or self.DEFAULT_DOMAIN_ID
 
         # First get all categories
         categories = await self.fetch_categories(domain_id)
 
-        for category in categories:
-            category_id = category.get("category_Id")
-            if category_id:
-                products = await self.fetch_products(
+        # Fetch categories concurrently; the client's rate limiter still
+        # paces the actual HTTP requests.
+        semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+
+        # _fetch_products raises, so failed categories reach the error
+        # count below instead of silently contributing no products
+        async def fetch_category(category_id: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_products(
                     category_id=category_id,
                     domain_id=domain_id,
                 )
-                all_products.extend(products)
 
-        logger.info(f"Fetched total of {len(all_products)} products from all categories")
+        results = await asyncio.gather(
+            *(
+                fetch_category(category_id)
+                for category_id in (c.get("category_Id") for c in categories)
+                if category_id
+            ),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to fetch category products: {result}")
+                self._stats["errors"] += 1
+
+        # Items listed under several categories are kept once, in first-seen order
+        by_code: Dict[Any, Dict[str, Any]] = {}
+        for product in chain.from_iterable(
+            result for result in results if not isinstance(result, Exception)
+        ):
+            by_code.setdefault(product.get("ItemCode"), product)
+        all_products = list(by_code.values())
+
+        logger.info("Fetched total of %d products from all categories", len(all_products))
         return all_products
 
     async def fetch_brands(self, domain_id: int = None) -> List[Dict[str, Any]]:
@@ -276,11 +343,11 @@ class BenSolimanScraper(BaseScraper):
             response = await self._client.get(
                 self.ENDPOINTS["brands"],
                 params={"domain_id": domain_id},
-                headers=self.DEFAULT_HEADERS,
+                extra_headers=self.DEFAULT_HEADERS,
             )
             # Response format: {"Brands": [...]}
             brands = response.get("Brands", []) if isinstance(response, dict) else response
-            logger.info(f"Fetched {len(brands)} brands from Ben Soliman")
+            logger.info("Fetched %d brands from Ben Soliman", len(brands))
             return brands
         except Exception as e:
             logger.error(f"Failed to fetch brands: {e}")
@@ -301,10 +368,10 @@ class BenSolimanScraper(BaseScraper):
             response = await self._client.get(
                 self.ENDPOINTS["offers"],
                 params={"domain_id": domain_id},
-                headers=self.DEFAULT_HEADERS,
+                extra_headers=self.DEFAULT_HEADERS,
             )
             offers = response if isinstance(response, list) else response.get("data", response.get("Offers", []))
-            logger.info(f"Fetched {len(offers)} offers from Ben Soliman")
+            logger.info("Fetched %d offers from Ben Soliman", len(offers))
             return offers
         except Exception as e:
             logger.error(f"Failed to fetch offers: {e}")
@@ -325,7 +392,7 @@ class BenSolimanScraper(BaseScraper):
             response = await self._client.get(
                 self.ENDPOINTS["home"],
                 params={"domain_id": domain_id},
-                headers=self.DEFAULT_HEADERS,
+                extra_headers=self.DEFAULT_HEADERS,
             )
             return response
         except Exception as e:
@@ -354,51 +421,66 @@ class BenSolimanScraper(BaseScraper):
         Returns:
             ProductCreate instance.
         """
-        # Extract price info
-        sell_price = raw_data.get("SellPrice") or raw_data.get("ItemPrice")
-        item_price = raw_data.get("ItemPrice")
+        # Read each field once; everything below works on locals
+        get = raw_data.get
+        item_code = get("ItemCode")
+        name = get("Name")
+        description = get("Description")
+        category_code = get("CategoryCode")
+        brand_id = get("BrandId")
+        image_name = get("ImageName")
+        balance = get("Balance")
+        u_codes = get("u_codes") or []
+        offers = get("Offers")
 
-        # Calculate discount if prices differ
-        discount_pct = None
-        if sell_price and item_price and float(item_price) > float(sell_price):
-            discount_pct = round((1 - float(sell_price) / float(item_price)) * 100, 2)
+        # Extract price info
+        item_price = get("ItemPrice")
+        sell_price = get("SellPrice") or item_price
 
         # Build image URL
-        image_name = raw_data.get("ImageName")
-        image_url = f"http://37.148.206.212/Icons/{image_name}" if image_name else None
+        image_url = _ICON_URL_PREFIX + image_name if image_name else None
 
         # Get unit info from u_codes
-        unit_name = "piece"
-        if raw_data.get("u_codes") and len(raw_data["u_codes"]) > 0:
-            unit_name = raw_data["u_codes"][0].get("U_Name", "piece")
+        unit_name = u_codes[0].get("U_Name", "piece") if u_codes else "piece"
+
+        barcode = get("BarCode")
+        # May arrive as a number or a numeric string such as "1.0"
+        min_quantity = get("MinimumQuantity")
 
-        return ProductCreate(
+        # Every field is converted explicitly above, so validation is skipped
+        return ProductCreate.model_construct(
             source_app=self.SOURCE_APP,
-            external_id=str(raw_data.get("ItemCode", "")),
-            name=raw_data.get("Name", ""),
-            name_ar=raw_data.get("Name"),  # API returns Arabic
-            description=raw_data.get("Description"),
-            description_ar=raw_data.get("Description"),
-            category_external_id=str(raw_data.get("CategoryCode")) if raw_data.get("CategoryCode") else None,
-            brand=str(raw_data.get("BrandId")) if raw_data.get("BrandId") else None,
-            sku=str(raw_data.get("ItemCode")),
-            barcode=raw_data.get("BarCode"),
+            external_id=str(item_code) if item_code is not None else "",
+            name=name if name is not None else "",
+            name_ar=name,  # API returns Arabic
+            description=description,
+            description_ar=description,
+            category_external_id=str(category_code) if category_code else None,
+            brand=str(brand_id) if brand_id else None,
+            sku=str(item_code),
+            barcode=str(barcode) if barcode is not None else None,
             image_url=image_url,
             unit_type=self._parse_unit(unit_name),
-            min_order_quantity=raw_data.get("MinimumQuantity", 1),
-            current_price=Decimal(str(sell_price)) if sell_price else None,
-            original_price=Decimal(str(item_price)) if item_price else None,
-            discount_percentage=discount_pct,
-            is_available=raw_data.get("Balance", 0) > 0,
+            min_order_quantity=(
+                int(to_decimal(min_quantity)) if min_quantity not in (None, "") else 1
+            ),
+            current_price=to_decimal(sell_price) if sell_price else None,
+            original_price=to_decimal(item_price) if item_price else None,
+            is_available=(balance or 0) > 0,
             extra_data={
-                "balance": raw_data.get("Balance"),
-                "sales_limit": raw_data.get("SalesLimit"),
-                "coins": raw_data.get("Coins"),
-                "stars": raw_data.get("Stars"),
-                "item_points": raw_data.get("ItemPoints"),
-                "is_favorite": raw_data.get("IsFav"),
-                "offers": raw_data.get("Offers", []),
-                "u_codes": raw_data.get("u_codes", []),
+                "balance": balance,
+                "sales_limit": get("SalesLimit"),
+                "coins": get("Coins"),
+                "stars": get("Stars"),
+                "item_points": get("ItemPoints"),
+                "is_favorite": get("IsFav"),
+                "offers": offers if offers is not None else [],
+                # Unit definitions only; the raw entries also carry
+                # per-unit stock, which "balance" already covers
+                "u_codes": [
+                    {"U_Code": u.get("U_Code"), "U_Name": u.get("U_Name"), "Factor": u.get("Factor")}
+                    for u in u_codes
+                ],
             },
         )
 
@@ -420,12 +502,13 @@ class BenSolimanScraper(BaseScraper):
         """
         # Build image URL
         image_name = raw_data.get("ImageName")
-        image_url = f"http://37.148.206.212/Icons/{image_name}" if image_name else None
+        image_url = _ICON_URL_PREFIX + image_name if image_name else None
 
-        return CategoryCreate(
+        # Every field is converted explicitly, so validation is skipped
+        return CategoryCreate.model_construct(
             source_app=self.SOURCE_APP,
             external_id=str(raw_data.get("category_Id", "")),
-            name=raw_data.get("Name", ""),
+            name=raw_data.get("Name") or "",
             name_ar=raw_data.get("Name"),  # API returns Arabic
             parent_external_id=None,  # No parent info in API
             image_url=image_url,
@@ -441,29 +524,6 @@ class BenSolimanScraper(BaseScraper):
         Returns:
             UnitType enum value.
         """
-        unit_mapping = {
-            "piece": UnitType.PIECE,
-            "pcs": UnitType.PIECE,
-            "unit": UnitType.PIECE,
-            "قطعة": UnitType.PIECE,
-            "kg": UnitType.KG,
-            "kilo": UnitType.KG,
-            "كيلو": UnitType.KG,
-            "gram": UnitType.GRAM,
-            "g": UnitType.GRAM,
-            "جرام": UnitType.GRAM,
-            "liter": UnitType.LITER,
-            "l": UnitType.LITER,
-            "لتر": UnitType.LITER,
-            "ml": UnitType.ML,
-            "pack": UnitType.PACK,
-            "عبوة": UnitType.PACK,
-            "box": UnitType.BOX,
-            "علبة": UnitType.BOX,
-            "carton": UnitType.CARTON,
-            "كرتونة": UnitType.CARTON,
-        }
-
         if unit_str:
-            return unit_mapping.get(unit_str.lower(), UnitType.PIECE)
+            return _UNIT_MAPPING.get(unit_str.lower(), UnitType.PIECE)
         return UnitType.PIECE
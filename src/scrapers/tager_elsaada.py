@@ -5,16 +5,32 @@ authentication flow, and response parsing must be updated after
 performing API discovery using mitmproxy/Frida.
 """
 import logging
-from typing import List, Dict, Any
-from decimal import Decimal
+from typing import List, Dict, Any, AsyncIterator
 
 from src.scrapers.base import BaseScraper
 from src.models.schemas import ProductCreate, CategoryCreate
 from src.models.enums import SourceApp, UnitType
 from src.config.settings import settings
+from src.utils.serialization import to_decimal
 
 logger = logging.getLogger(__name__)
 
+# Unit names as returned by the Tager elSaada API (lowercased)
+_UNIT_MAPPING = {
+    "piece": UnitType.PIECE,
+    "pcs": UnitType.PIECE,
+    "kg": UnitType.KG,
+    "kilo": UnitType.KG,
+    "gram": UnitType.GRAM,
+    "g": UnitType.GRAM,
+    "liter": UnitType.LITER,
+    "l": UnitType.LITER,
+    "ml": UnitType.ML,
+    "pack": UnitType.PACK,
+    "box": UnitType.BOX,
+    "carton": UnitType.CARTON,
+}
+
 
 class TagerElsaadaScraper(BaseScraper):
     """Scraper for Tager elSaada wholesale app.
@@ -116,7 +132,7 @@ class TagerElsaadaScraper(BaseScraper):
             if isinstance(raw_categories, list):
                 categories = raw_categories
 
-            logger.info(f"Fetched {len(categories)} categories from Tager elSaada")
+            logger.info("Fetched %d categories from Tager elSaada", len(categories))
 
         except Exception as e:
             logger.error(f"Failed to fetch categories: {e}")
@@ -126,17 +142,30 @@ class TagerElsaadaScraper(BaseScraper):
     async def fetch_products(self, category_id: str = None) -> List[Dict[str, Any]]:
         """Fetch products from Tager elSaada.
 
-        TODO: Update endpoint, pagination, and filtering after API discovery.
-
         Args:
             category_id: Optional category filter.
 
         Returns:
             List of product data dictionaries.
         """
-        products = []
+        products = [product async for product in self.iter_products(category_id)]
+        logger.info("Fetched %d products from Tager elSaada", len(products))
+        return products
+
+    async def iter_products(self, category_id: str = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream products from Tager elSaada page by page.
+
+        TODO: Update endpoint, pagination, and filtering after API discovery.
+
+        Args:
+            category_id: Optional category filter.
+
+        Yields:
+            Product data dictionaries, as each page arrives.
+        """
         page = 1
         has_more = True
+        count = 0
 
         try:
             while has_more:
@@ -148,13 +177,16 @@ class TagerElsaadaScraper(BaseScraper):
                 response = await self._client.get(
                     self.ENDPOINTS["products"],
                     params=params,
+                    response_type=self.PRODUCTS_RESPONSE_TYPE,
                 )
 
                 # TODO: Update based on actual response format
                 raw_products = response.get("data", response.get("products", []))
 
                 if isinstance(raw_products, list):
-                    products.extend(raw_products)
+                    for product in raw_products:
+                        yield product
+                    count += len(raw_products)
 
                     # Check for more pages
                     # TODO: Update pagination check based on actual response
@@ -164,15 +196,12 @@ class TagerElsaadaScraper(BaseScraper):
                 else:
                     has_more = False
 
-                logger.debug(f"Fetched page {page-1}, total products so far: {len(products)}")
-
-            logger.info(f"Fetched {len(products)} products from Tager elSaada")
+                # Lazy formatting: skipped entirely when DEBUG is off
+                logger.debug("Fetched page %d, total products so far: %d", page - 1, count)
 
         except Exception as e:
             logger.error(f"Failed to fetch products: {e}")
 
-        return products
-
     def parse_product(self, raw_data: Dict[str, Any]) -> ProductCreate:
         """Parse Tager elSaada product response into ProductCreate.
 
@@ -185,27 +214,37 @@ class TagerElsaadaScraper(BaseScraper):
             ProductCreate instance.
         """
         # TODO: Update field mappings based on actual API response
+        get = raw_data.get
+        category_id = get("category_id")
+        unit_value = get("unit_value")
+        original_price = get("original_price")
+        unit = get("unit")
+
         return ProductCreate(
             source_app=self.SOURCE_APP,
-            external_id=str(raw_data.get("id", "")),
-            name=raw_data.get("name", raw_data.get("name_en", "")),
-            name_ar=raw_data.get("name_ar", raw_data.get("name")),
-            description=raw_data.get("description", raw_data.get("description_en")),
-            description_ar=raw_data.get("description_ar"),
-            category_external_id=str(raw_data.get("category_id", "")) if raw_data.get("category_id") else None,
-            category_name=raw_data.get("category_name"),
-            brand=raw_data.get("brand", raw_data.get("brand_name")),
-            sku=raw_data.get("sku", raw_data.get("item_code")),
-            barcode=raw_data.get("barcode", raw_data.get("upc")),
-            image_url=raw_data.get("image", raw_data.get("image_url", raw_data.get("thumbnail"))),
-            additional_images=raw_data.get("images", raw_data.get("gallery", [])),
-            unit_type=self._parse_unit(raw_data.get("unit", "piece")),
-            unit_value=Decimal(str(raw_data.get("unit_value", 1))) if raw_data.get("unit_value") else None,
-            min_order_quantity=raw_data.get("min_quantity", raw_data.get("min_order", 1)),
+            external_id=str(get("id", "")),
+            name=get("name") or get("name_en") or "",
+            name_ar=get("name_ar") or get("name"),
+            description=get("description") or get("description_en"),
+            description_ar=get("description_ar"),
+            category_external_id=str(category_id) if category_id else None,
+            category_name=get("category_name"),
+            brand=get("brand") or get("brand_name"),
+            sku=get("sku") or get("item_code"),
+            barcode=get("barcode") or get("upc"),
+            image_url=get("image") or get("image_url") or get("thumbnail"),
+            additional_images=get("images") or get("gallery") or [],
+            unit_type=self._parse_unit(unit or "piece"),
+            unit_value=to_decimal(unit_value) if unit_value else None,
+            # 0 is a real value; fall back only when the field is absent
+            min_order_quantity=v if (v := get("min_quantity")) is not None else get("min_order", 1),
+            current_price=to_decimal(get("price", 0)),
+            original_price=to_decimal(original_price) if original_price else None,
+            is_available=get("is_available", True),
             extra_data={
-                "raw_unit": raw_data.get("unit"),
-                "pack_size": raw_data.get("pack_size"),
-                "weight": raw_data.get("weight"),
+                "raw_unit": unit,
+                "pack_size": get("pack_size"),
+                "weight": get("weight"),
             },
         )
 
@@ -220,14 +259,18 @@ class TagerElsaadaScraper(BaseScraper):
         Returns:
             CategoryCreate instance.
         """
+        get = raw_data.get
+        parent_id = get("parent_id")
+
         return CategoryCreate(
             source_app=self.SOURCE_APP,
-            external_id=str(raw_data.get("id", "")),
-            name=raw_data.get("name", raw_data.get("name_en", "")),
-            name_ar=raw_data.get("name_ar", raw_data.get("name")),
-            parent_external_id=str(raw_data.get("parent_id")) if raw_data.get("parent_id") else None,
-            image_url=raw_data.get("image", raw_data.get("icon")),
-            sort_order=raw_data.get("sort_order", raw_data.get("position", 0)),
+            external_id=str(get("id", "")),
+            name=get("name") or get("name_en") or "",
+            name_ar=get("name_ar") or get("name"),
+            parent_external_id=str(parent_id) if parent_id else None,
+            image_url=get("image") or get("icon"),
+            # 0 is a real value; fall back only when the field is absent
+            sort_order=v if (v := get("sort_order")) is not None else get("position", 0),
         )
 
     def _parse_unit(self, unit_str: str) -> UnitType:
@@ -239,21 +282,6 @@ class TagerElsaadaScraper(BaseScraper):
         Returns:
             UnitType enum value.
         """
-        unit_mapping = {
-            "piece": UnitType.PIECE,
-            "pcs": UnitType.PIECE,
-            "kg": UnitType.KG,
-            "kilo": UnitType.KG,
-            "gram": UnitType.GRAM,
-            "g": UnitType.GRAM,
-            "liter": UnitType.LITER,
-            "l": UnitType.LITER,
-            "ml": UnitType.ML,
-            "pack": UnitType.PACK,
-            "box": UnitType.BOX,
-            "carton": UnitType.CARTON,
-        }
-
         if unit_str:
-            return unit_mapping.get(unit_str.lower(), UnitType.PIECE)
+            return _UNIT_MAPPING.get(unit_str.lower(), UnitType.PIECE)
         return UnitType.PIECE
@@ -19,6 +19,17 @@ class ArabicTextProcessor:
         re.UNICODE,
     )
 
+    # Separators left dangling after removing the weight from a name
+    TRAILING_SEPARATOR = re.compile(r"\s*[-/]\s*$")
+    LEADING_SEPARATOR = re.compile(r"^\s*[-/]\s*")
+
+    # Any character in the Arabic Unicode block
+    ARABIC_CHAR = re.compile(r"[\u0600-\u06FF]")
+
+    # Decimal numbers, and currency text surrounding prices
+    NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+    CURRENCY_PATTERN = re.compile(r"[جنيهEGPLE\s]", re.IGNORECASE)
+
     # Unit translations
     UNIT_TRANSLATIONS = {
         "جرام": "gram",
@@ -94,8 +105,8 @@ class ArabicTextProcessor:
 
             clean_name = name.replace(weight_str, "").strip()
             # Clean up extra separators
-            clean_name = re.sub(r"\s*[-/]\s*$", "", clean_name)
-            clean_name = re.sub(r"^\s*[-/]\s*", "", clean_name)
+            clean_name = cls.TRAILING_SEPARATOR.sub("", clean_name)
+            clean_name = cls.LEADING_SEPARATOR.sub("", clean_name)
             clean_name = " ".join(clean_name.split())
 
             return clean_name, weight_value, unit_en
@@ -114,7 +125,7 @@ class ArabicTextProcessor:
         """
         if not text:
             return False
-        return bool(re.search(r"[\u0600-\u06FF]", text))
+        return cls.ARABIC_CHAR.search(text) is not None
 
     @classmethod
     def extract_numbers(cls, text: str) -> list:
@@ -133,7 +144,7 @@ class ArabicTextProcessor:
         text = text.translate(cls.ARABIC_DIGITS)
 
         # Extract numbers
-        return re.findall(r"\d+(?:\.\d+)?", text)
+        return cls.NUMBER_PATTERN.findall(text)
 
     @classmethod
     def clean_price_text(cls, price_text: str) -> Optional[float]:
@@ -152,13 +163,13 @@ class ArabicTextProcessor:
         text = price_text.translate(cls.ARABIC_DIGITS)
 
         # Remove currency symbols and text
-        text = re.sub(r"[جنيهEGPLE\s]", "", text, flags=re.IGNORECASE)
+        text = cls.CURRENCY_PATTERN.sub("", text)
 
         # Find the number
-        match = re.search(r"(\d+(?:\.\d+)?)", text)
+        match = cls.NUMBER_PATTERN.search(text)
         if match:
             try:
-                return float(match.group(1))
+                return float(match.group(0))
             except ValueError:
                 return None
 
@@ -0,0 +1,25 @@
+"""Event loop setup helpers."""
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's event loop policy when it is installed.
+
+    Must be called before the event loop is created (i.e. before
+    ``asyncio.run``). uvloop is not available on Windows, where the
+    default asyncio loop is kept.
+
+    Returns:
+        True if uvloop was installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using default asyncio loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,6 +1,5 @@
 """Async HTTP client with retry logic and rate limiting."""
 import httpx
-import asyncio
 import logging
 from typing import Dict, Any, Optional
 from tenacity import (
@@ -19,10 +18,28 @@ from .exceptions import (
 )
 from .rate_limiter import RateLimiter, RequestJitter
 from .fingerprint import DeviceFingerprint
+from .serialization import dumps, loads, decode
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_backoff = wait_exponential(multiplier=1, min=2, max=30)
+
+
+def _wait_before_retry(retry_state) -> float:
+    """Wait out Retry-After on a 429, else back off exponentially.
+
+    Args:
+        retry_state: Tenacity retry state of the failed attempt.
+
+    Returns:
+        Seconds to sleep before the next attempt.
+    """
+    error = retry_state.outcome.exception()
+    if isinstance(error, RateLimitError) and error.retry_after is not None:
+        return error.retry_after
+    return _backoff(retry_state)
+
 
 class AsyncAPIClient:
     """Async HTTP client with retry logic, rate limiting, and anti-detection."""
@@ -59,7 +76,7 @@ class AsyncAPIClient:
             timeout=httpx.Timeout(self.timeout),
             limits=httpx.Limits(
                 max_connections=settings.max_connections,
-                max_keepalive_connections=5,
+                max_keepalive_connections=settings.max_connections,
             ),
             http2=True,  # Use HTTP/2 if available
         )
@@ -116,8 +133,8 @@ class AsyncAPIClient:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((NetworkError, httpx.TimeoutException)),
+        wait=_wait_before_retry,
+        retry=retry_if_exception_type((NetworkError, RateLimitError, httpx.TimeoutException)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
     )
     async def request(
@@ -129,6 +146,7 @@ class AsyncAPIClient:
         data: Dict[str, Any] = None,
         extra_headers: Dict[str, str] = None,
         add_jitter: bool = True,
+        response_type: Any = None,
     ) -> Dict[str, Any]:
         """Make an HTTP request with retry logic.
 
@@ -140,6 +158,7 @@ class AsyncAPIClient:
             data: Form data.
             extra_headers: Additional headers for this request.
             add_jitter: Whether to add random delay before request.
+            response_type: Optional msgspec type to decode the body into.
 
         Returns:
             Parsed JSON response.
@@ -163,17 +182,23 @@ class AsyncAPIClient:
         url = f"{self.base_url}{endpoint}"
         headers = self._build_headers(extra_headers)
 
+        # Encode JSON bodies with orjson rather than httpx's stdlib encoder
+        content = None
+        if json_data is not None:
+            content = dumps(json_data)
+            headers["Content-Type"] = "application/json"
+
         try:
             response = await self._client.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json_data,
+                content=content,
                 data=data,
                 headers=headers,
             )
 
-            return await self._handle_response(response)
+            return await self._handle_response(response, response_type)
 
         except httpx.TimeoutException as e:
             logger.warning(f"Request timeout for {url}: {e}")
@@ -182,11 +207,14 @@ class AsyncAPIClient:
             logger.warning(f"Network error for {url}: {e}")
             raise NetworkError(f"Network error: {e}")
 
-    async def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
+    async def _handle_response(
+        self, response: httpx.Response, response_type: Any = None
+    ) -> Dict[str, Any]:
         """Handle HTTP response and errors.
 
         Args:
             response: HTTP response object.
+            response_type: Optional msgspec type to decode the body into.
 
         Returns:
             Parsed JSON response.
@@ -197,7 +225,10 @@ class AsyncAPIClient:
             APIError: For other API errors.
         """
         if response.status_code == 200:
-            return response.json()
+            self.rate_limiter.record_success()
+            if response_type is not None:
+                return decode(response.content, response_type)
+            return loads(response.content)
 
         elif response.status_code == 401:
             raise AuthenticationError("Authentication failed or token expired")
@@ -207,8 +238,10 @@ class AsyncAPIClient:
 
         elif response.status_code == 429:
             retry_after = int(response.headers.get("Retry-After", 60))
-            logger.warning(f"Rate limited. Waiting {retry_after}s")
-            await asyncio.sleep(retry_after)
+            logger.warning(f"Rate limited. Retrying after {retry_after}s")
+            # Slow down until enough requests succeed again; the retry
+            # policy does the Retry-After wait
+            self.rate_limiter.slow_down()
             raise RateLimitError(retry_after)
 
         elif response.status_code >= 500:
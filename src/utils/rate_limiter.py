@@ -7,7 +7,18 @@ logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
-    """Token bucket rate limiter for controlling API request frequency."""
+    """Token bucket rate limiter for controlling API request frequency.
+
+    The sustained rate adapts AIMD-style: slow_down() cuts it after a 429
+    and record_success() restores it step by step, up to the configured
+    rate, once requests succeed again.
+    """
+
+    # Successful requests at the reduced rate before each recovery step
+    RECOVERY_SUCCESSES = 20
+
+    # Rate restored per recovery step, as a fraction of the configured rate
+    RECOVERY_STEP = 0.1
 
     def __init__(
         self,
@@ -21,7 +32,9 @@ class RateLimiter:
             burst_size: Maximum number of requests that can be made in a burst.
         """
         self.requests_per_second = requests_per_second
+        self.max_requests_per_second = requests_per_second
         self.burst_size = burst_size
+        self._successes = 0
         self.tokens = float(burst_size)
         self.last_update = time.monotonic()
         self._lock = asyncio.Lock()
@@ -63,8 +76,46 @@ class RateLimiter:
         new_tokens = elapsed * self.requests_per_second
         self.tokens = min(self.burst_size, self.tokens + new_tokens)
 
+    def slow_down(self, factor: float = 0.5, min_rate: float = 0.1) -> None:
+        """Lower the sustained rate after the server reports rate limiting.
+
+        Also drains the bucket so no burst follows the slowdown. The cut is
+        temporary; record_success() wins the rate back.
+
+        Args:
+            factor: Multiplier applied to the current rate.
+            min_rate: Rate never to drop below.
+        """
+        self.requests_per_second = max(min_rate, self.requests_per_second * factor)
+        self.tokens = 0.0
+        self.last_update = time.monotonic()
+        self._successes = 0
+        logger.info(f"Rate limiter slowed to {self.requests_per_second:.2f} requests/s")
+
+    def record_success(self) -> None:
+        """Count a successful request, raising a reduced rate back up.
+
+        Every RECOVERY_SUCCESSES successes below the configured rate add
+        RECOVERY_STEP of it back, capped at the configured rate.
+        """
+        if self.requests_per_second >= self.max_requests_per_second:
+            return
+
+        self._successes += 1
+        if self._successes < self.RECOVERY_SUCCESSES:
+            return
+
+        self._successes = 0
+        self.requests_per_second = min(
+            self.max_requests_per_second,
+            self.requests_per_second + self.max_requests_per_second * self.RECOVERY_STEP,
+        )
+        logger.info(f"Rate limiter recovered to {self.requests_per_second:.2f} requests/s")
+
     def reset(self) -> None:
         """Reset the rate limiter to initial state."""
+        self.requests_per_second = self.max_requests_per_second
+        self._successes = 0
         self.tokens = float(self.burst_size)
         self.last_update = time.monotonic()
 
@@ -0,0 +1,96 @@
+"""Fast JSON serialization helpers backed by orjson."""
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+import msgspec
+import orjson
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or a string.
+
+    Args:
+        data: Raw JSON payload.
+
+    Returns:
+        Parsed Python object.
+    """
+    return orjson.loads(data)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """Convert a JSON number or numeric string to a Decimal.
+
+    Ints and strings are passed to Decimal directly, which is cheaper
+    than round-tripping through ``str``. Floats go through ``repr`` so the
+    result is the shortest decimal form rather than the exact binary value.
+
+    Args:
+        value: Int, float, or numeric string from a decoded payload.
+
+    Returns:
+        Decimal value.
+    """
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    return Decimal(value)
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson doesn't handle natively.
+
+    Args:
+        obj: Unsupported object.
+
+    Returns:
+        JSON-compatible value.
+
+    Raises:
+        TypeError: If the type is not supported.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string.
+
+    Used as the SQLAlchemy ``json_serializer`` for JSONB columns. Handles
+    dataclasses (including the report schemas) natively and Decimals as
+    strings.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON string.
+    """
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+@lru_cache(maxsize=None)
+def _get_decoder(response_type: Any) -> msgspec.json.Decoder:
+    """Get a reusable msgspec decoder for a type.
+
+    Args:
+        response_type: Target type for decoding.
+
+    Returns:
+        Cached decoder instance.
+    """
+    return msgspec.json.Decoder(response_type)
+
+
+def decode(data: bytes, response_type: Any) -> Any:
+    """Parse JSON directly into a typed structure in a single pass.
+
+    Args:
+        data: Raw JSON payload.
+        response_type: msgspec-compatible target type.
+
+    Returns:
+        Decoded object of the requested type.
+    """
+    return _get_decoder(response_type).decode(data)